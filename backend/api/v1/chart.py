@@ -39,7 +39,7 @@ from backend.services.billing.entitlements import (
     check_chart_entitlement,
     mark_chart_issued,
 )
-from backend.services.astrology.geocoder import Geocoder, GeocodingError
+from backend.services.astrology.geocoder import GeocodingError, get_geocoder
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +124,7 @@ async def compute_chart(
     lat, lon = req.latitude, req.longitude
     if lat is None:
         try:
-            location = await Geocoder().geocode(req.birth_place)
+            location = await get_geocoder().geocode(req.birth_place)
         except GeocodingError as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
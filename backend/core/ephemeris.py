@@ -15,6 +15,7 @@ deviation across all 10 bodies is 0.17″ (Moon) against a 2″ bar.
 from __future__ import annotations
 
 import hashlib
+import mmap
 import os
 from datetime import date
 from functools import lru_cache
@@ -118,16 +119,35 @@ def _startup_probe() -> None:
 _startup_probe()
 
 
+_HASH_CHUNK = 4 << 20  # 4 MiB slices keep the hash buffer small
+
+
+def _sha256_mmap(path: Path) -> tuple[str, int]:
+    """Hash a file through mmap instead of read_bytes.
+
+    read_bytes copies the whole file onto the heap and throws it away;
+    mapping it hashes straight from the OS page cache, which then stays
+    warm for swisseph's own reads of the same .se1 files.
+    """
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return hashlib.sha256().hexdigest(), 0
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sha = hashlib.sha256()
+            for offset in range(0, size, _HASH_CHUNK):
+                sha.update(mm[offset : offset + _HASH_CHUNK])
+            return sha.hexdigest(), size
+
+
 @lru_cache(maxsize=1)
 def ephemeris_files() -> tuple[dict, ...]:
     """sha256 provenance for the shipped .se1 files (hashed once)."""
     out = []
     for name in REQUIRED_FILES:
         path = EPHE_DIR / name
-        digest = hashlib.sha256(path.read_bytes()).hexdigest()
-        out.append(
-            {"path": str(path), "sha256": digest, "size": path.stat().st_size}
-        )
+        digest, size = _sha256_mmap(path)
+        out.append({"path": str(path), "sha256": digest, "size": size})
     return tuple(out)
 
 
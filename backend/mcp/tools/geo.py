@@ -10,16 +10,22 @@ from __future__ import annotations
 from datetime import date as date_cls, time as time_cls
 from typing import Any, Optional
 
-from backend.services.astrology.geocoder import Geocoder, GeocodingError
+from backend.services.astrology.geocoder import (
+    Geocoder,
+    GeocodingError,
+    get_geocoder,
+)
 
 
+# Lazy handle kept as a module attribute so tests can reset it; the real
+# construction is the process-wide get_geocoder() singleton.
 _geocoder: Optional[Geocoder] = None
 
 
 def _geo() -> Geocoder:
     global _geocoder
     if _geocoder is None:
-        _geocoder = Geocoder()
+        _geocoder = get_geocoder()
     return _geocoder
 
 
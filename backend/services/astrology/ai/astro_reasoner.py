@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -313,7 +314,6 @@ class AstroReasoner:
         }
 
         # Try to extract score
-        import re
         score_match = re.search(r"(\d{1,3})\s*%", response)
         if score_match:
             result["favorability_score"] = int(score_match.group(1))
@@ -21,6 +21,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+import math
+
 try:
     import swisseph as swe
 except ImportError as exc:  # pragma: no cover
@@ -158,8 +160,6 @@ def acg_lines(
     split at the antimeridian into separate features so each is a valid
     LineString. Pure geometry — no interpretation.
     """
-    import math
-
     gmst = swe.sidtime(jd_ut) * 15.0
     equ = natal_equatorial(jd_ut)
     features: list[dict] = []
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from itertools import combinations
 from typing import Iterable, List
 
 from ..policies import orbs
@@ -17,15 +18,19 @@ ASPECT_ANGLES = {
     "opposition": 180.0,
 }
 
+# Frozen snapshot for the hot loops: tuple iteration avoids rebuilding a
+# dict_items view per pair.
+ASPECT_ITEMS: tuple[tuple[str, float], ...] = tuple(ASPECT_ANGLES.items())
 
-@dataclass
+
+@dataclass(slots=True)
 class BodyState:
     name: str
     longitude: float
     speed: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AspectResult:
     planet1: str
     planet2: str
@@ -46,30 +51,34 @@ def _delta_angle(angle_a: float, angle_b: float) -> float:
 def detect_aspects(bodies: Iterable[BodyState]) -> List[AspectResult]:
     body_list = list(bodies)
     results: List[AspectResult] = []
-    for i, first in enumerate(body_list):
-        for second in body_list[i + 1 :]:
-            angle = abs(_delta_angle(second.longitude, first.longitude))
-            for aspect_name, target in ASPECT_ANGLES.items():
-                orb_limit = orbs.natal_orb_for(first.name)
-                delta = abs(angle - target)
-                if delta <= orb_limit:
-                    applying = _is_applying(first, second, target)
-                    results.append(
-                        AspectResult(
-                            planet1=first.name,
-                            planet2=second.name,
-                            aspect=aspect_name,
-                            orb=delta,
-                            applying=applying,
-                        )
+    for first, second in combinations(body_list, 2):
+        signed = _delta_angle(second.longitude, first.longitude)
+        angle = abs(signed)
+        orb_limit = orbs.natal_orb_for(first.name)
+        # Advance both bodies 0.1 days once per pair; the applying test for
+        # every aspect target reuses these two signed separations.
+        dt = 0.1
+        future_signed = _delta_angle(
+            second.longitude + second.speed * dt,
+            first.longitude + first.speed * dt,
+        )
+        for aspect_name, target in ASPECT_ITEMS:
+            delta = abs(angle - target)
+            if delta <= orb_limit:
+                delta_now = signed - target
+                if delta_now <= -180:
+                    delta_now += 360
+                delta_future = future_signed - target
+                if delta_future <= -180:
+                    delta_future += 360
+                applying = abs(delta_future) < abs(delta_now)
+                results.append(
+                    AspectResult(
+                        planet1=first.name,
+                        planet2=second.name,
+                        aspect=aspect_name,
+                        orb=delta,
+                        applying=applying,
                     )
+                )
     return results
-
-
-def _is_applying(first: BodyState, second: BodyState, target_angle: float) -> bool:
-    delta_now = _delta_angle(second.longitude - target_angle, first.longitude)
-    dt = 0.1  # days
-    lon_first_future = first.longitude + first.speed * dt
-    lon_second_future = second.longitude + second.speed * dt
-    delta_future = _delta_angle(lon_second_future - target_angle, lon_first_future)
-    return abs(delta_future) < abs(delta_now)
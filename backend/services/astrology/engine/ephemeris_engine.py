@@ -9,14 +9,14 @@ import swisseph as swe
 from backend.core import ephemeris as ephe_config
 
 
-@dataclass
+@dataclass(slots=True)
 class EphemerisFileInfo:
     path: str
     sha256: str
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EphemerisConfig:
     ephemeris_engine: str
     flags: int
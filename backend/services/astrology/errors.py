@@ -41,18 +41,44 @@ class AstrologyError(Exception):
     ):
         self.code = code
         self.message = message
-        self.suggestions = suggestions or []
+        self.suggestions = list(suggestions) if suggestions else []
         self.details = details or {}
+        self._dict: Optional[dict] = None
         super().__init__(message)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for API response."""
-        return {
-            "code": self.code.value,
-            "message": self.message,
-            "suggestions": self.suggestions,
-            "details": self.details,
-        }
+        """Convert to dictionary for API response (built once per instance)."""
+        if self._dict is None:
+            self._dict = {
+                "code": self.code.value,
+                "message": self.message,
+                "suggestions": self.suggestions,
+                "details": self.details,
+            }
+        return self._dict
+
+
+# Static suggestion lists, built once instead of per raised instance.
+_GEOCODING_SUGGESTIONS = (
+    "Уточните название города (например: 'Москва, Россия')",
+    "Проверьте правильность написания",
+    "Попробуйте указать координаты напрямую",
+)
+
+_EPHEMERIS_SUGGESTIONS = (
+    "Проверьте, что дата находится в поддерживаемом диапазоне",
+    "Попробуйте повторить запрос позже",
+)
+
+_RATE_LIMIT_SUGGESTIONS = (
+    "Подождите указанное время",
+    "Используйте кэшированные данные",
+)
+
+_LLM_SUGGESTIONS = (
+    "Астрологические данные рассчитаны корректно",
+    "Интерпретация будет доступна позже",
+)
 
 
 class GeocodingError(AstrologyError):
@@ -63,16 +89,10 @@ class GeocodingError(AstrologyError):
         if reason:
             message += f": {reason}"
 
-        suggestions = [
-            "Уточните название города (например: 'Москва, Россия')",
-            "Проверьте правильность написания",
-            "Попробуйте указать координаты напрямую",
-        ]
-
         super().__init__(
             code=AstrologyErrorCode.GEOCODING_FAILED,
             message=message,
-            suggestions=suggestions,
+            suggestions=_GEOCODING_SUGGESTIONS,
             details={"place": place, "reason": reason},
         )
 
@@ -82,15 +102,11 @@ class EphemerisError(AstrologyError):
 
     def __init__(self, reason: str, date: Optional[str] = None):
         message = f"Ошибка расчета эфемерид: {reason}"
-        suggestions = [
-            "Проверьте, что дата находится в поддерживаемом диапазоне",
-            "Попробуйте повторить запрос позже",
-        ]
 
         super().__init__(
             code=AstrologyErrorCode.EPHEMERIS_UNAVAILABLE,
             message=message,
-            suggestions=suggestions,
+            suggestions=_EPHEMERIS_SUGGESTIONS,
             details={"reason": reason, "date": date},
         )
 
@@ -123,10 +139,7 @@ class RateLimitError(AstrologyError):
         super().__init__(
             code=AstrologyErrorCode.RATE_LIMIT_EXCEEDED,
             message=f"Превышен лимит запросов. Повторите через {retry_after} секунд.",
-            suggestions=[
-                "Подождите указанное время",
-                "Используйте кэшированные данные",
-            ],
+            suggestions=_RATE_LIMIT_SUGGESTIONS,
             details={"retry_after": retry_after},
         )
 
@@ -138,10 +151,7 @@ class LLMError(AstrologyError):
         super().__init__(
             code=AstrologyErrorCode.LLM_ERROR,
             message=f"Ошибка генерации интерпретации: {reason}",
-            suggestions=[
-                "Астрологические данные рассчитаны корректно",
-                "Интерпретация будет доступна позже",
-            ],
+            suggestions=_LLM_SUGGESTIONS,
             details={"reason": reason},
         )
 
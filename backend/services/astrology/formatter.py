@@ -8,13 +8,23 @@ accuracy of the underlying Swiss Ephemeris data.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
 
 from .interpreter import PLANET_DESCRIPTIONS, SIGN_DESCRIPTIONS
-from .schemas import Aspect, AspectType, House, Planet, PlanetPosition, ZodiacSign
-
-
-PLANET_SYMBOLS: dict[Planet, str] = {
+from .schemas import (
+    ZODIAC_SIGN_ORDER,
+    Aspect,
+    AspectType,
+    House,
+    Planet,
+    PlanetPosition,
+    ZodiacSign,
+)
+
+
+PLANET_SYMBOLS: Mapping[Planet, str] = MappingProxyType({
     Planet.SUN: "☉",
     Planet.MOON: "☽",
     Planet.MERCURY: "☿",
@@ -28,35 +38,35 @@ PLANET_SYMBOLS: dict[Planet, str] = {
     Planet.NORTH_NODE: "☊",
     Planet.SOUTH_NODE: "☋",
     Planet.CHIRON: "⚷",
-}
+})
 
 
-ASPECT_SYMBOLS: dict[AspectType, str] = {
+ASPECT_SYMBOLS: Mapping[AspectType, str] = MappingProxyType({
     AspectType.CONJUNCTION: "☌",
     AspectType.SEXTILE: "⚹",
     AspectType.SQUARE: "□",
     AspectType.TRINE: "△",
     AspectType.OPPOSITION: "☍",
     AspectType.QUINCUNX: "⚻",
-}
+})
 
 
-ELEMENT_TRANSLATIONS = {
+ELEMENT_TRANSLATIONS = MappingProxyType({
     "fire": {"ru": "огонь", "en": "fire"},
     "earth": {"ru": "земля", "en": "earth"},
     "air": {"ru": "воздух", "en": "air"},
     "water": {"ru": "вода", "en": "water"},
-}
+})
 
 
-QUALITY_TRANSLATIONS = {
+QUALITY_TRANSLATIONS = MappingProxyType({
     "cardinal": {"ru": "кардинальный", "en": "cardinal"},
     "fixed": {"ru": "фиксированный", "en": "fixed"},
     "mutable": {"ru": "мутабельный", "en": "mutable"},
-}
+})
 
 
-SIGN_PREPOSITIONAL_RU = {
+SIGN_PREPOSITIONAL_RU = MappingProxyType({
     ZodiacSign.ARIES: "Овне",
     ZodiacSign.TAURUS: "Тельце",
     ZodiacSign.GEMINI: "Близнецах",
@@ -69,10 +79,10 @@ SIGN_PREPOSITIONAL_RU = {
     ZodiacSign.CAPRICORN: "Козероге",
     ZodiacSign.AQUARIUS: "Водолее",
     ZodiacSign.PISCES: "Рыбах",
-}
+})
 
 
-ASPECT_NAMES = {
+ASPECT_NAMES = MappingProxyType({
     "ru": {
         AspectType.CONJUNCTION: "Соединение",
         AspectType.SEXTILE: "Секстиль",
@@ -89,10 +99,10 @@ ASPECT_NAMES = {
         AspectType.OPPOSITION: "Opposition",
         AspectType.QUINCUNX: "Quincunx",
     },
-}
+})
 
 
-ASPECT_DESCRIPTIONS = {
+ASPECT_DESCRIPTIONS = MappingProxyType({
     "scientific": {
         "ru": "аспект с орбом {orb:.2f}° ({applying})",
         "en": "aspect with {orb:.2f}° orb ({applying})",
@@ -101,16 +111,16 @@ ASPECT_DESCRIPTIONS = {
         "ru": "тонкая связь с орбом {orb:.2f}° ({applying})",
         "en": "a subtle tie with {orb:.2f}° orb ({applying})",
     },
-}
+})
 
 
-APPLYING_TRANSLATIONS = {
+APPLYING_TRANSLATIONS = MappingProxyType({
     "ru": {True: "нарастающий", False: "расходящийся"},
     "en": {True: "applying", False: "separating"},
-}
+})
 
 
-PLANET_NAMES_EN = {
+PLANET_NAMES_EN = MappingProxyType({
     Planet.SUN: "Sun",
     Planet.MOON: "Moon",
     Planet.MERCURY: "Mercury",
@@ -124,10 +134,10 @@ PLANET_NAMES_EN = {
     Planet.NORTH_NODE: "North Node",
     Planet.SOUTH_NODE: "South Node",
     Planet.CHIRON: "Chiron",
-}
+})
 
 
-SIGN_NAMES_EN = {
+SIGN_NAMES_EN = MappingProxyType({
     ZodiacSign.ARIES: "Aries",
     ZodiacSign.TAURUS: "Taurus",
     ZodiacSign.GEMINI: "Gemini",
@@ -140,16 +150,143 @@ SIGN_NAMES_EN = {
     ZodiacSign.CAPRICORN: "Capricorn",
     ZodiacSign.AQUARIUS: "Aquarius",
     ZodiacSign.PISCES: "Pisces",
-}
-
-
-@dataclass
+})
+
+
+def _build_planet_view() -> dict[Planet, tuple[str, str, str, list[str]]]:
+    """Flatten the per-planet lookups into one tuple per enum member.
+
+    (symbol, name_ru, name_en, keywords_joined) — fallbacks for missing
+    description entries are baked in here so the render loop does a
+    single dict hit and tuple unpack per planet. Keywords are pre-joined:
+    the tables are static, so the ", ".join never changes.
+    """
+    view = {}
+    for planet in Planet:
+        data = PLANET_DESCRIPTIONS.get(planet)
+        view[planet] = (
+            PLANET_SYMBOLS.get(planet, ""),
+            data.ru if data else planet.value,
+            PLANET_NAMES_EN.get(planet, planet.value.title()),
+            ", ".join(data.keywords) if data else "",
+        )
+    return view
+
+
+def _build_sign_view() -> dict[ZodiacSign, tuple]:
+    """Flatten the per-sign lookups into one tuple per enum member.
+
+    (name_ru, name_en, prepositional_ru, element_ru, element_en,
+    quality_ru, quality_en, keywords_joined) with the element/quality
+    strings already capitalized and keywords pre-joined; None where a
+    sign has no description entry.
+    """
+    view = {}
+    for sign in ZODIAC_SIGN_ORDER:
+        data = SIGN_DESCRIPTIONS.get(sign)
+        name_ru = data.ru if data else sign.value
+        element = ELEMENT_TRANSLATIONS.get(data.element) if data else None
+        quality = QUALITY_TRANSLATIONS.get(data.quality) if data else None
+        view[sign] = (
+            name_ru,
+            SIGN_NAMES_EN.get(sign, sign.value.title()),
+            SIGN_PREPOSITIONAL_RU.get(sign, name_ru),
+            element["ru"].capitalize() if element else None,
+            element["en"].capitalize() if element else None,
+            quality["ru"].capitalize() if quality else None,
+            quality["en"].capitalize() if quality else None,
+            ", ".join(data.keywords) if data else "",
+        )
+    return view
+
+
+PLANET_VIEW = MappingProxyType(_build_planet_view())
+SIGN_VIEW = MappingProxyType(_build_sign_view())
+
+
+# Static per-language labels, shared by the formatter constructor and the
+# memoized planet renderer below.
+_LANG_LABELS = MappingProxyType({
+    "ru": {
+        "chart_title": "Натальная карта",
+        "aspects_header": "**Аспекты:**",
+        "element": "Элемент: ",
+        "quality": "Качество: ",
+        "keywords": "Ключевые слова: ",
+        "poetic_suffix": " — энергия раскрывается интуитивно.",
+        "poetic_default": "Энергия проявляется интуитивно.",
+    },
+    "en": {
+        "chart_title": "Natal Chart",
+        "aspects_header": "**Aspects:**",
+        "element": "Element: ",
+        "quality": "Mode: ",
+        "keywords": "Keywords: ",
+        "poetic_suffix": " — energy flows in its own rhythm.",
+        "poetic_default": "Energy flows in its own rhythm.",
+    },
+})
+
+
+@lru_cache(maxsize=512)
+def _render_planet(
+    language: str, style: str, planet: Planet, sign: ZodiacSign, retrograde: bool
+) -> tuple[str, str, str]:
+    """(title, description, label) for a planet placement.
+
+    Everything here is a pure function of the five arguments, and there are
+    only 13 × 12 × 2 placements per language/style — so across repeated
+    chart requests each string is built exactly once.
+    """
+    symbol, planet_ru, planet_en, planet_keywords = PLANET_VIEW[planet]
+    (
+        sign_ru,
+        sign_en,
+        preposition_ru,
+        element_ru,
+        element_en,
+        quality_ru,
+        quality_en,
+        sign_keywords,
+    ) = SIGN_VIEW[sign]
+    labels = _LANG_LABELS[language]
+
+    if sign_keywords and planet_keywords:
+        keywords = f"{sign_keywords}, {planet_keywords}"
+    else:
+        keywords = sign_keywords or planet_keywords
+
+    if language == "ru":
+        label = f"{planet_ru} в {preposition_ru} ({sign_en})"
+        element, quality = element_ru, quality_ru
+    else:
+        label = f"{planet_en} in {sign_en} ({sign_ru})"
+        element, quality = element_en, quality_en
+
+    element_txt = f"{labels['element']}{element}" if element else ""
+    quality_txt = f"{labels['quality']}{quality}" if quality else ""
+    keywords_txt = labels["keywords"] + keywords if keywords else ""
+    description = " · ".join(filter(None, [element_txt, quality_txt, keywords_txt]))
+    if style == "poetic":
+        description = (
+            description + labels["poetic_suffix"] if description else labels["poetic_default"]
+        )
+
+    retrograde_marker = " (R)" if retrograde else ""
+    title = f"{symbol} **{label}**{retrograde_marker}  "
+    return title, description, label
+
+
+@dataclass(slots=True)
 class FormattedPlanet:
     """Structured representation of a formatted planet entry."""
 
     title: str
     description: str
     raw: PlanetPosition
+    # The bolded "Planet in Sign (…)" core of the title, kept separately so
+    # the aspect loop never has to re-parse the markdown.
+    label: str = ""
 
 
 class ChartFormatter:
@@ -160,6 +297,22 @@ class ChartFormatter:
         self.style = style if style in {"scientific", "poetic"} else "scientific"
         self.output_format = output_format if output_format in {"markdown", "json"} else "markdown"
 
+        # Language and style are fixed for the formatter's lifetime, so the
+        # translation tables and static labels are resolved once here instead
+        # of re-branching for every planet and aspect rendered.
+        self._aspect_names = ASPECT_NAMES[self.language]
+        self._applying_labels = APPLYING_TRANSLATIONS[self.language]
+        # Full aspect line as a single precompiled template: the orb/applying
+        # detail is inlined so each aspect costs one str.format call.
+        self._aspect_text_template = (
+            "{s1} {n1} {sym} {s2} {n2} ({aspect_name}) — "
+            + ASPECT_DESCRIPTIONS[self.style][self.language]
+            + "."
+        )
+        labels = _LANG_LABELS[self.language]
+        self._chart_title = labels["chart_title"]
+        self._aspects_header = labels["aspects_header"]
+
     def generate(
         self,
         planets: Iterable[PlanetPosition],
@@ -168,107 +321,107 @@ class ChartFormatter:
     ):
         """Generate a formatted report for the natal chart."""
 
-        planet_entries = [self._format_planet(planet) for planet in planets]
-        aspect_entries = [self._format_aspect(aspect, planet_entries) for aspect in aspects or []]
-        ascendant_entry = self._format_ascendant(houses)
+        # Materialize once: callers may hand in generators, and houses is
+        # scanned again by _format_ascendant.
+        planet_list = list(planets)
+        aspect_list = list(aspects) if aspects is not None else []
+        house_list = list(houses) if houses is not None else []
+
+        if not planet_list and not aspect_list and not house_list:
+            if self.output_format == "json":
+                return {
+                    "title": self._chart_title,
+                    "planets": [],
+                    "ascendant": None,
+                    "aspects": [],
+                }
+            return f"# {self._chart_title}"
+
+        # Bind the bound methods once; the comprehensions then use LOAD_FAST
+        # instead of an attribute lookup per planet/aspect.
+        fmt_aspect = self._format_aspect
 
         if self.output_format == "json":
+            # Machine-readable path: go straight from cached render tuples
+            # to dicts, skipping the FormattedPlanet intermediary that only
+            # the markdown renderer needs.
+            render = _render_planet
+            language, style = self.language, self.style
+            label_map: dict[Planet, str] = {}
+            planet_dicts = []
+            for position in planet_list:
+                title, description, label = render(
+                    language, style, position.planet, position.sign, position.retrograde
+                )
+                label_map[position.planet] = label
+                planet_dicts.append(
+                    {
+                        "planet": position.planet.value,
+                        "sign": position.sign.value,
+                        "degree": position.degree,
+                        "sign_degree": position.sign_degree,
+                        "retrograde": position.retrograde,
+                        "house": position.house,
+                        "title": title,
+                        "description": description,
+                    }
+                )
             return {
-                "title": "Natal Chart" if self.language == "en" else "Натальная карта",
-                "planets": [self._planet_to_dict(entry) for entry in planet_entries],
-                "ascendant": ascendant_entry,
-                "aspects": aspect_entries,
+                "title": self._chart_title,
+                "planets": planet_dicts,
+                "ascendant": self._format_ascendant(house_list),
+                "aspects": [fmt_aspect(aspect, label_map) for aspect in aspect_list],
             }
 
+        fmt_planet = self._format_planet
+        planet_entries = [fmt_planet(planet) for planet in planet_list]
+        label_map = {entry.raw.planet: entry.label for entry in planet_entries}
+        aspect_entries = [fmt_aspect(aspect, label_map) for aspect in aspect_list]
+        ascendant_entry = self._format_ascendant(house_list)
+
         return self._render_markdown(planet_entries, ascendant_entry, aspect_entries)
 
     def _render_markdown(self, planets: list[FormattedPlanet], ascendant: Optional[dict], aspects: list[dict]) -> str:
-        title = "# Natal Chart" if self.language == "en" else "# Натальная карта"
-        lines: list[str] = [title]
+        lines: list[str] = [f"# {self._chart_title}"]
 
+        extend = lines.extend
         if ascendant:
-            lines.append(ascendant["title"])
-            lines.append(ascendant["description"])
-            lines.append("")
+            extend((ascendant["title"], ascendant["description"], ""))
 
         for entry in planets:
-            lines.append(entry.title)
-            lines.append(entry.description)
-            lines.append("")
+            extend((entry.title, entry.description, ""))
 
         if aspects:
-            lines.append("**Aspects:**" if self.language == "en" else "**Аспекты:**")
-            for aspect in aspects:
-                lines.append(f"- {aspect['text']}")
+            lines.append(self._aspects_header)
+            extend(f"- {aspect['text']}" for aspect in aspects)
 
-        return "\n".join(line.rstrip() for line in lines if line is not None)
+        # Plain join: nothing appends None, and rstrip here used to eat the
+        # intentional two-space markdown hard breaks at the end of titles.
+        return "\n".join(lines)
 
     def _format_planet(self, planet: PlanetPosition) -> FormattedPlanet:
-        sign_data = SIGN_DESCRIPTIONS.get(planet.sign)
-        planet_data = PLANET_DESCRIPTIONS.get(planet.planet)
-        sign_ru = sign_data.get("ru") if sign_data else planet.sign.value
-        sign_en = SIGN_NAMES_EN.get(planet.sign, planet.sign.value.title())
-        planet_ru = planet_data.get("ru") if planet_data else planet.planet.value
-        planet_en = PLANET_NAMES_EN.get(planet.planet, planet.planet.value.title())
-
-        preposition_ru = SIGN_PREPOSITIONAL_RU.get(planet.sign, sign_ru)
-        symbol = PLANET_SYMBOLS.get(planet.planet, "")
-        retrograde_marker = " (R)" if planet.retrograde else ""
-
-        if self.language == "ru":
-            title = f"{symbol} **{planet_ru} в {preposition_ru} ({sign_en})**{retrograde_marker}  "
-        else:
-            title = f"{symbol} **{planet_en} in {sign_en} ({sign_ru})**{retrograde_marker}  "
-
-        description = self._planet_description(planet, sign_data, planet_data)
-
-        return FormattedPlanet(title=title, description=description, raw=planet)
-
-    def _planet_description(self, planet: PlanetPosition, sign_data: dict, planet_data: dict) -> str:
-        element = ELEMENT_TRANSLATIONS.get(sign_data.get("element")) if sign_data else None
-        quality = QUALITY_TRANSLATIONS.get(sign_data.get("quality")) if sign_data else None
-        keywords = sign_data.get("keywords", []) + planet_data.get("keywords", []) if sign_data and planet_data else []
-
-        if self.language == "ru":
-            element_txt = f"Элемент: {element['ru'].capitalize()}" if element else ""
-            quality_txt = f"Качество: {quality['ru'].capitalize()}" if quality else ""
-            keywords_txt = "Ключевые слова: " + ", ".join(keywords) if keywords else ""
-            base = " · ".join(filter(None, [element_txt, quality_txt, keywords_txt]))
-            if self.style == "poetic":
-                base = base + " — энергия раскрывается интуитивно." if base else "Энергия проявляется интуитивно."
-            return base
-
-        element_txt = f"Element: {element['en'].capitalize()}" if element else ""
-        quality_txt = f"Mode: {quality['en'].capitalize()}" if quality else ""
-        keywords_txt = "Keywords: " + ", ".join(keywords) if keywords else ""
-        base = " · ".join(filter(None, [element_txt, quality_txt, keywords_txt]))
-        if self.style == "poetic":
-            base = base + " — energy flows in its own rhythm." if base else "Energy flows in its own rhythm."
-        return base
-
-    def _format_aspect(self, aspect: Aspect, planets: list[FormattedPlanet]) -> dict:
-        planet_map = {entry.raw.planet: entry for entry in planets}
-        p1 = planet_map.get(aspect.planet1)
-        p2 = planet_map.get(aspect.planet2)
-
-        p1_name = PLANET_NAMES_EN.get(aspect.planet1, aspect.planet1.value.title())
-        p2_name = PLANET_NAMES_EN.get(aspect.planet2, aspect.planet2.value.title())
-        p1_local = PLANET_DESCRIPTIONS.get(aspect.planet1, {}).get("ru", p1_name)
-        p2_local = PLANET_DESCRIPTIONS.get(aspect.planet2, {}).get("ru", p2_name)
-
-        p1_label = p1.title.split("**")[1].split("**")[0] if p1 else p1_name
-        p2_label = p2.title.split("**")[1].split("**")[0] if p2 else p2_name
-
-        aspect_symbol = ASPECT_SYMBOLS.get(aspect.aspect_type, "")
-        aspect_name = ASPECT_NAMES[self.language][aspect.aspect_type]
-        applying = APPLYING_TRANSLATIONS[self.language][aspect.applying]
-        aspect_template = ASPECT_DESCRIPTIONS[self.style][self.language]
-        detail = aspect_template.format(orb=aspect.orb, applying=applying)
-
-        if self.language == "ru":
-            text = f"{PLANET_SYMBOLS.get(aspect.planet1, '')} {p1_local} {aspect_symbol} {PLANET_SYMBOLS.get(aspect.planet2, '')} {p2_local} ({aspect_name}) — {detail}."
-        else:
-            text = f"{PLANET_SYMBOLS.get(aspect.planet1, '')} {p1_label} {aspect_symbol} {PLANET_SYMBOLS.get(aspect.planet2, '')} {p2_label} ({aspect_name}) — {detail}."
+        title, description, label = _render_planet(
+            self.language, self.style, planet.planet, planet.sign, planet.retrograde
+        )
+        return FormattedPlanet(title=title, description=description, raw=planet, label=label)
+
+    def _format_aspect(self, aspect: Aspect, label_map: dict[Planet, str]) -> dict:
+        p1_symbol, p1_local, p1_name, _ = PLANET_VIEW[aspect.planet1]
+        p2_symbol, p2_local, p2_name, _ = PLANET_VIEW[aspect.planet2]
+
+        p1_label = label_map.get(aspect.planet1) or p1_name
+        p2_label = label_map.get(aspect.planet2) or p2_name
+
+        text = self._aspect_text_template.format(
+            s1=p1_symbol,
+            n1=p1_local if self.language == "ru" else p1_label,
+            sym=ASPECT_SYMBOLS.get(aspect.aspect_type, ""),
+            s2=p2_symbol,
+            n2=p2_local if self.language == "ru" else p2_label,
+            aspect_name=self._aspect_names[aspect.aspect_type],
+            orb=aspect.orb,
+            applying=self._applying_labels[aspect.applying],
+        )
 
         return {
             "planet1": aspect.planet1.value,
@@ -287,10 +440,9 @@ class ChartFormatter:
         if not first_house:
             return None
 
-        sign_ru = SIGN_DESCRIPTIONS.get(first_house.sign, {}).get("ru", first_house.sign.value)
-        sign_en = SIGN_NAMES_EN.get(first_house.sign, first_house.sign.value.title())
+        sign_ru, sign_en, preposition_ru = SIGN_VIEW[first_house.sign][:3]
         if self.language == "ru":
-            title = f"↑ **Асцендент в {SIGN_PREPOSITIONAL_RU.get(first_house.sign, sign_ru)} (Asc {sign_en})**  "
+            title = f"↑ **Асцендент в {preposition_ru} (Asc {sign_en})**  "
             description = "Проявление личности вовне."  # concise placeholder, retains scientific data provenance
         else:
             title = f"↑ **Ascendant in {sign_en} ({sign_ru})**  "
@@ -302,16 +454,3 @@ class ChartFormatter:
             "sign": first_house.sign.value,
             "degree": first_house.degree,
         }
-
-    def _planet_to_dict(self, planet: FormattedPlanet) -> dict:
-        return {
-            "planet": planet.raw.planet.value,
-            "sign": planet.raw.sign.value,
-            "degree": planet.raw.degree,
-            "sign_degree": planet.raw.sign_degree,
-            "retrograde": planet.raw.retrograde,
-            "house": planet.raw.house,
-            "title": planet.title,
-            "description": planet.description,
-        }
-
@@ -2,27 +2,139 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
+import re
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
+from zoneinfo import available_timezones
 
+import orjson
 from timezonefinder import TimezoneFinder
 
+try:
+    # Optional Rust-backed lookup (PyO3): ray-casting in compiled code,
+    # the fastest single-point path available without writing the kernel.
+    # Same IANA polygon data; purely an acceleration when installed.
+    import tzfpy
+except ImportError:  # pragma: no cover - optional accelerator
+    tzfpy = None
+
 from backend.utils.geonames_resolver import geonames_lookup
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _shared_tzfinder() -> TimezoneFinder:
+    """One TimezoneFinder per process — loading its polygon data is the
+    dominant cost of constructing a Geocoder, and the dataset is read-only.
+
+    in_memory=True loads the polygon FlatBuffers into RAM once instead of
+    seeking through the binary files on every lookup; the lru_cache also
+    makes concurrent first-construction safe (one instance per process).
+
+    With the [numba] extra installed the ray-casting runs JIT-compiled;
+    one warm-up query here absorbs the compilation cost so the first real
+    user request does not pay it. Without numba the pure-Python path
+    still works — we log which one is active rather than assert.
+    """
+    finder = TimezoneFinder(in_memory=True)
+    if TimezoneFinder.using_numba():
+        logger.debug("[Geocoder] timezonefinder numba acceleration active")
+    else:
+        logger.warning(
+            "[Geocoder] timezonefinder running without numba acceleration — "
+            "install timezonefinder[numba] for the JIT point-in-polygon path"
+        )
+    finder.timezone_at(lng=0.0, lat=0.0)
+    return finder
+
+
 class GeocodingError(Exception):
     """Raised when strict geocoding requirements are not met."""
 
 
-@dataclass
+# Process-wide geocode cache: the same place strings recur across users,
+# and GeoNames is both slow (network round-trip) and quota-limited, so a
+# hit turns the whole geocode into a dict lookup. Keyed by
+# "<provider>|<normalized query>"; bounded LRU like the resolver cache.
+_GEO_CACHE: "OrderedDict[str, GeoLocation]" = OrderedDict()
+_GEO_CACHE_MAX = 4096
+
+# Failed lookups are cached too (as (stored_at, error_code)), but only
+# briefly — a typo should not be re-sent to GeoNames on every retry, yet
+# must not be poisoned forever (the place may simply be missing from the
+# free tier today). Queries shorter than the gate are never cached so a
+# quick retype after a slip is unaffected.
+_NEGATIVE_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_NEGATIVE_CACHE_MAX = 1024
+_NEGATIVE_TTL_SECONDS = 300.0
+_NEGATIVE_MIN_QUERY_LEN = 3
+
+
+def _remember_negative(cache_key: str, code: str) -> None:
+    if len(cache_key.split("|", 1)[-1]) < _NEGATIVE_MIN_QUERY_LEN:
+        return
+    _NEGATIVE_CACHE[cache_key] = (time.monotonic(), code)
+    if len(_NEGATIVE_CACHE) > _NEGATIVE_CACHE_MAX:
+        _NEGATIVE_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _iana_zones() -> frozenset:
+    """Known IANA zone names, loaded once (the tzdata scan hits the disk)."""
+    return frozenset(available_timezones())
+
+
+# Cheapest filter first: place names are letters plus a little common
+# punctuation. Control characters, 500-char pastes and pure-numeric junk
+# can never resolve, so they are rejected locally instead of spending a
+# rate-limited network round-trip to learn PLACE_NOT_FOUND.
+# ’ (U+2019) and ʼ (U+02BC) are what mobile smart punctuation types for
+# the apostrophe in L’Aquila / N’Djamena; & appears in real toponyms
+# (Tyne & Wear).
+_VALID_QUERY_RE = re.compile(r"^[\w\s,.\-'’ʼ&()/]{2,200}$", re.UNICODE)
+_DIGITS_ONLY_RE = re.compile(r"^[\d\s,.\-()/]+$")
+
+
+# What identifies a geocoding resolution for provenance purposes: which
+# place was asked for and which concrete GeoNames entity answered.
+_FINGERPRINT_KEYS = (
+    "input",
+    "geonameId",
+    "resolved_name",
+    "country",
+    "lat",
+    "lon",
+    "timezone",
+)
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+def _clear_geocode_caches() -> None:
+    """Test hook: drop both caches."""
+    _GEO_CACHE.clear()
+    _NEGATIVE_CACHE.clear()
+
+
+@dataclass(slots=True, frozen=True)
 class GeoLocation:
-    """Geocoded location with provenance data."""
+    """Geocoded location with provenance data.
+
+    frozen: instances are shared through the process-wide cache, so no
+    caller may mutate what another will read. slots+frozen also drops the
+    per-instance __dict__ for the thousands of cached results.
+    """
 
     name: str
     latitude: float
@@ -31,7 +143,10 @@ class GeoLocation:
     provider: str
     query: str
     raw_response_id: str
-    timestamp: datetime
+    # Raw clock read (~20 ns) instead of building a tz-aware datetime per
+    # instance; the datetime is materialized lazily via the `timestamp`
+    # property only when something actually reads it.
+    timestamp_ns: int = field(default_factory=time.time_ns)
     country: Optional[str] = None
     admin_area: Optional[str] = None
     # False when the resolver had to fall back to the most populous candidate
@@ -45,6 +160,11 @@ class GeoLocation:
     candidates: list = field(default_factory=list)
     ambiguous: bool = False
 
+    @property
+    def timestamp(self) -> datetime:
+        """Resolution time as an aware UTC datetime (computed on access)."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
 
 class Geocoder:
     """Strict geocoder that refuses to guess coordinates or timezone."""
@@ -52,7 +172,7 @@ class Geocoder:
     def __init__(self, provider: Optional[str] = None, username: Optional[str] = None):
         self.provider = provider or "geonames"
         self.username = username
-        self.tzfinder = TimezoneFinder()
+        self.tzfinder = _shared_tzfinder()
 
     async def geocode(self, query: str) -> GeoLocation:
         """
@@ -67,42 +187,85 @@ class Geocoder:
         Raises:
             GeocodingError: If place not found or geocoding fails
         """
-        logger.info(f"[Geocoder] Starting geocoding for: '{query}'")
+        logger.info("[Geocoder] Starting geocoding for: '%s'", query)
 
         if not query or not query.strip():
-            logger.error(f"[Geocoder] Query is empty or invalid")
+            logger.error("[Geocoder] Query is empty or invalid")
             raise GeocodingError("PLACE_QUERY_REQUIRED")
 
+        stripped = query.strip()
+        if not _VALID_QUERY_RE.match(stripped) or _DIGITS_ONLY_RE.match(stripped):
+            logger.warning("[Geocoder] Rejecting malformed place query %r", query)
+            raise GeocodingError("PLACE_QUERY_INVALID")
+
+        cache_key = f"{self.provider}|{_normalize_query(query)}"
+        cached = _GEO_CACHE.get(cache_key)
+        if cached is not None:
+            _GEO_CACHE.move_to_end(cache_key)
+            logger.debug("[Geocoder] Cache hit for '%s'", query)
+            return cached
+
+        negative = _NEGATIVE_CACHE.get(cache_key)
+        if negative is not None:
+            stored_at, code = negative
+            if time.monotonic() - stored_at < _NEGATIVE_TTL_SECONDS:
+                logger.debug("[Geocoder] Negative cache hit for '%s' (%s)", query, code)
+                raise GeocodingError(code)
+            del _NEGATIVE_CACHE[cache_key]
+
         try:
             # Use GeoNames API for geocoding
-            logger.debug(f"[Geocoder] Calling geonames_lookup...")
+            logger.debug("[Geocoder] Calling geonames_lookup...")
             result = await geonames_lookup(query)
-            logger.debug(f"[Geocoder] geonames_lookup returned: {result}")
+            logger.debug("[Geocoder] geonames_lookup returned: %r", result)
 
-            # Get timezone: prefer GeoNames response, fallback to TimezoneFinder
+            # Get timezone: prefer GeoNames response, fallback to TimezoneFinder.
+            # The hint is a cheap dict read that skips the point-in-polygon
+            # test entirely — but only when it names a zone our tzdata knows,
+            # so a stale or malformed value never reaches zoneinfo later.
             timezone_name = result.get("timezone")
-            logger.debug(f"[Geocoder] GeoNames timezone: {timezone_name}")
+            logger.debug("[Geocoder] GeoNames timezone: %s", timezone_name)
+
+            if timezone_name and timezone_name not in _iana_zones():
+                logger.warning(
+                    "[Geocoder] GeoNames returned unknown timezone %r for '%s' — "
+                    "falling back to TimezoneFinder",
+                    timezone_name,
+                    query,
+                )
+                timezone_name = None
 
             if not timezone_name:
-                logger.info(f"[Geocoder] Timezone not in response, using TimezoneFinder...")
+                logger.info("[Geocoder] Timezone not in response, using TimezoneFinder...")
                 timezone_name = self._timezone_for(result["lat"], result["lon"])
-                logger.debug(f"[Geocoder] TimezoneFinder returned: {timezone_name}")
+                logger.debug("[Geocoder] TimezoneFinder returned: %s", timezone_name)
 
-            # Create response hash for provenance
-            payload = json.dumps(result, sort_keys=True).encode("utf-8")
-            raw_response_id = hashlib.sha256(payload).hexdigest()
+            # Create response hash for provenance. No adversary is involved —
+            # the ID is an opaque content fingerprint — so BLAKE2b-128 over
+            # compact canonical JSON is plenty: faster than SHA-256 on these
+            # small payloads and half the hex length. orjson serializes the
+            # dict in C; stdlib json.dumps walked it in pure Python and
+            # dominated the fingerprint cost. Only the fields that identify
+            # the resolution are hashed — the candidates pool can be an
+            # order of magnitude larger and adds nothing to identity.
+            identity = {key: result.get(key) for key in _FINGERPRINT_KEYS}
+            payload = orjson.dumps(identity, option=orjson.OPT_SORT_KEYS)
+            raw_response_id = hashlib.blake2b(payload, digest_size=16).hexdigest()
 
+            # timezone/country are drawn from a small finite set but arrive
+            # as fresh strings per response; interning dedupes them across
+            # the many GeoLocation instances that end up cached.
+            country = result.get("country")
             geo_location = GeoLocation(
                 name=result["resolved_name"],
                 latitude=result["lat"],
                 longitude=result["lon"],
-                timezone=timezone_name,
+                timezone=sys.intern(timezone_name) if isinstance(timezone_name, str) else timezone_name,
                 provider="geonames",
                 query=query,
                 raw_response_id=raw_response_id,
-                timestamp=datetime.now(tz=timezone.utc),
-                country=result.get("country"),
-                admin_area=None,  # GeoNames basic API doesn't provide admin area
+                country=sys.intern(country) if isinstance(country, str) else country,
+                admin_area=result.get("admin_area"),
                 name_matched=bool(result.get("name_matched", True)),
                 requested_city=result.get("requested_city"),
                 candidates=list(result.get("candidates") or []),
@@ -111,23 +274,58 @@ class Geocoder:
 
             if not geo_location.name_matched:
                 logger.warning(
-                    f"[Geocoder] ⚠ '{query}' resolved to '{geo_location.name}' "
-                    f"which does not match the requested city — coordinates suspect"
+                    "[Geocoder] ⚠ '%s' resolved to '%s' which does not match "
+                    "the requested city — coordinates suspect",
+                    query,
+                    geo_location.name,
                 )
 
-            logger.info(f"[Geocoder] ✓ SUCCESS: Geocoded '{query}' to {geo_location.name}, {geo_location.country}")
-            logger.debug(f"[Geocoder] Location: {geo_location.latitude}, {geo_location.longitude}, TZ: {geo_location.timezone}")
+            logger.info("[Geocoder] ✓ SUCCESS: Geocoded '%s' to %s, %s", query, geo_location.name, geo_location.country)
+            logger.debug("[Geocoder] Location: %s, %s, TZ: %s", geo_location.latitude, geo_location.longitude, geo_location.timezone)
+
+            _GEO_CACHE[cache_key] = geo_location
+            if len(_GEO_CACHE) > _GEO_CACHE_MAX:
+                _GEO_CACHE.popitem(last=False)
 
             return geo_location
 
         except ValueError as exc:
             # GeoNames raised "Place not found"
-            logger.warning(f"[Geocoder] ✗ FAILED: Place not found for '{query}': {exc}")
+            logger.warning("[Geocoder] ✗ FAILED: Place not found for '%s': %s", query, exc)
+            _remember_negative(cache_key, "PLACE_NOT_FOUND")
             raise GeocodingError("PLACE_NOT_FOUND") from exc
+        except GeocodingError as exc:
+            # TIMEZONE_NOT_FOUND from _timezone_for is deterministic for the
+            # resolved coordinates, so it is worth remembering too. It also
+            # keeps its own code now instead of being flattened to the
+            # catch-all GEOCODER_ERROR below.
+            logger.warning("[Geocoder] ✗ FAILED: %s for '%s'", exc, query)
+            _remember_negative(cache_key, str(exc))
+            raise
         except Exception as exc:
-            logger.error(f"[Geocoder] ✗ CRITICAL ERROR: Geocoding error for '{query}': {type(exc).__name__}: {exc}", exc_info=True)
+            logger.error("[Geocoder] ✗ CRITICAL ERROR: Geocoding error for '%s': %s: %s", query, type(exc).__name__, exc, exc_info=True)
             raise GeocodingError("GEOCODER_ERROR") from exc
 
+    async def geocode_many(
+        self, queries: Iterable[str], max_concurrency: int = 4
+    ) -> list:
+        """Geocode several place names concurrently.
+
+        Launches the lookups under a semaphore so bulk callers (profile
+        imports, backfills) overlap network latency without stampeding the
+        GeoNames quota. Mirrors geonames_lookup_batch: failures come back
+        as exception objects in-position rather than aborting the batch.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(place: str):
+            async with sem:
+                return await self.geocode(place)
+
+        return await asyncio.gather(
+            *(_one(place) for place in queries), return_exceptions=True
+        )
+
     def resolve_timezone(self, lat: float, lon: float) -> str:
         """IANA zone for coordinates, as a ValueError on failure.
 
@@ -144,8 +342,61 @@ class Geocoder:
                 f"({exc}). Supply timezone_name explicitly."
             ) from exc
 
+    def resolve_timezones(
+        self, coords: Iterable[tuple[float, float]]
+    ) -> list[Optional[str]]:
+        """Resolve IANA zones for many coordinate pairs at once.
+
+        Deduplicates on the same ~100 m rounding as the single-point path,
+        so a batch import clustered in a handful of cities pays for each
+        distinct location once and everything else is a dict hit. Points
+        the timezone database cannot place come back as None in-position
+        rather than aborting the batch.
+        """
+        rounded = [(round(lat, 3), round(lon, 3)) for lat, lon in coords]
+        resolved: dict[tuple[float, float], Optional[str]] = {}
+        for key in rounded:
+            if key not in resolved:
+                resolved[key] = _timezone_at_rounded(*key)
+        return [resolved[key] for key in rounded]
+
     def _timezone_for(self, lat: float, lon: float) -> str:
-        tz = self.tzfinder.timezone_at(lat=lat, lng=lon)
+        # Birth places cluster in cities, so memoize on ~100 m-rounded
+        # coordinates; the point-in-polygon walk is the expensive part.
+        tz = _timezone_at_rounded(round(lat, 3), round(lon, 3))
         if tz is None:
             raise GeocodingError("TIMEZONE_NOT_FOUND")
         return tz
+
+
+@lru_cache(maxsize=1)
+def get_geocoder() -> Geocoder:
+    """Process-wide Geocoder.
+
+    The instance holds no per-request state — its heavy parts (the
+    TimezoneFinder dataset, the geocode caches, the httpx pool) are
+    already shared at module/process scope — so every call site can use
+    one object instead of constructing its own. lru_cache doubles as the
+    thread-safe once-only constructor, as with _shared_tzfinder.
+    """
+    return Geocoder()
+
+
+@lru_cache(maxsize=2048)
+def _timezone_at_rounded(lat: float, lon: float) -> Optional[str]:
+    # Rust kernel first when available — exact polygon test, compiled.
+    if tzfpy is not None:
+        tz = tzfpy.get_tz(lon, lat)
+        if tz:
+            return tz
+    # Fast path next: when the H3 shortcut cell contains a single zone —
+    # i.e. almost everywhere inland — unique_timezone_at answers from the
+    # shortcut index without any polygon geometry, and is exact. Only
+    # border cells fall through to the full ray-casting check. A lossy
+    # TimezoneFinderL-style approximation is deliberately NOT used: a
+    # wrong zone near a border shifts every house cusp by an hour.
+    finder = _shared_tzfinder()
+    tz = finder.unique_timezone_at(lat=lat, lng=lon)
+    if tz is not None:
+        return tz
+    return finder.timezone_at(lat=lat, lng=lon)
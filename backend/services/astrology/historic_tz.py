@@ -39,7 +39,14 @@ _tf: Optional["TimezoneFinder"] = None
 def _finder() -> Optional["TimezoneFinder"]:
     global _tf
     if _tf is None and TimezoneFinder is not None:
-        _tf = TimezoneFinder()
+        try:
+            # Reuse the geocoder's process-wide instance instead of loading
+            # a second copy of the polygon dataset.
+            from backend.services.astrology.geocoder import _shared_tzfinder
+
+            _tf = _shared_tzfinder()
+        except Exception:  # pragma: no cover - geocoder deps unavailable
+            _tf = TimezoneFinder()
     return _tf
 
 
@@ -56,11 +63,22 @@ class BirthMoment:
 
 
 def timezone_for(lat: float, lon: float) -> Optional[str]:
-    """IANA timezone name for coordinates, or None if unresolvable."""
-    tf = _finder()
-    if tf is None:
-        return None
-    return tf.timezone_at(lat=lat, lng=lon)
+    """IANA timezone name for coordinates, or None if unresolvable.
+
+    Goes through the geocoder's memoized rounded-coordinate lookup when
+    available, so repeated charts for the same birth place share one
+    point-in-polygon computation; ~100 m rounding is far finer than any
+    zone boundary that tzdata distinguishes.
+    """
+    try:
+        from backend.services.astrology.geocoder import _timezone_at_rounded
+
+        return _timezone_at_rounded(round(lat, 3), round(lon, 3))
+    except Exception:  # pragma: no cover - geocoder deps unavailable
+        tf = _finder()
+        if tf is None:
+            return None
+        return tf.timezone_at(lat=lat, lng=lon)
 
 
 def resolve_birth_moment(
@@ -1,11 +1,21 @@
 """LLM-based astrological interpretation."""
 
-import json
+import asyncio
+import hashlib
+import io
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
+import orjson
+
 from .schemas import (
     Aspect,
     AspectType,
@@ -21,126 +31,461 @@ from .ai.astro_reasoner import AstroReasoner
 
 logger = logging.getLogger(__name__)
 
+# Exact-key cache for reasoner interpretations. Inputs repeat heavily —
+# everyone asking for today's horoscope with the same sign triple, or the
+# same natal data re-submitted — and each miss costs an LLM round-trip
+# measured in seconds. Keys canonicalize every field that reaches the
+# prompt (degrees and orbs rounded to 0.1°, lists sorted), so a hit is a
+# byte-identical prompt, not a "similar" one. TTL keeps horoscope text
+# from outliving its period by much.
+_REASON_CACHE: "OrderedDict[tuple, tuple[float, object]]" = OrderedDict()
+_REASON_CACHE_MAX = 4096
+_REASON_CACHE_TTL = 3600.0  # seconds
+_REASON_CACHE_LOCK = asyncio.Lock()
+
+
+async def _cached_reason(key: tuple, coro_factory):
+    """Return a cached reasoner result for `key`, or await `coro_factory()`.
+
+    Only successful results are stored — an exception propagates to the
+    caller's template fallback and is never cached.
+    """
+    async with _REASON_CACHE_LOCK:
+        hit = _REASON_CACHE.get(key)
+        if hit is not None:
+            stored_at, value = hit
+            if time.monotonic() - stored_at <= _REASON_CACHE_TTL:
+                _REASON_CACHE.move_to_end(key)
+                return value
+            del _REASON_CACHE[key]
+
+    value = await coro_factory()
+
+    async with _REASON_CACHE_LOCK:
+        _REASON_CACHE[key] = (time.monotonic(), value)
+        _REASON_CACHE.move_to_end(key)
+        while len(_REASON_CACHE) > _REASON_CACHE_MAX:
+            _REASON_CACHE.popitem(last=False)
+    return value
+
+
 # Load lunar tables for horoscope generation
 _LUNAR_TABLES = None
+_LUNAR_TABLES_LOCK = threading.Lock()
 
 
 def _load_lunar_tables():
-    """Load lunar day descriptions from JSON."""
+    """Load lunar day descriptions from JSON.
+
+    Thread-safe: the preload thread started at module bottom and the first
+    request may race here; the lock ensures the file is parsed once.
+    """
     global _LUNAR_TABLES
     if _LUNAR_TABLES is not None:
         return _LUNAR_TABLES
 
-    lunar_json_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        "data",
-        "lunar_tables.json",
-    )
+    with _LUNAR_TABLES_LOCK:
+        if _LUNAR_TABLES is not None:
+            return _LUNAR_TABLES
 
-    try:
-        with open(lunar_json_path, "r", encoding="utf-8") as f:
-            _LUNAR_TABLES = json.load(f)
-        logger.info(f"Loaded lunar tables from {lunar_json_path}")
-    except Exception as e:
-        logger.warning(f"Failed to load lunar tables: {e}")
-        _LUNAR_TABLES = {"ru": [], "en": []}
+        lunar_json_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "data",
+            "lunar_tables.json",
+        )
+
+        try:
+            with open(lunar_json_path, "rb") as f:
+                _LUNAR_TABLES = orjson.loads(f.read())
+            logger.info(f"Loaded lunar tables from {lunar_json_path}")
+        except Exception as e:
+            logger.warning(f"Failed to load lunar tables: {e}")
+            _LUNAR_TABLES = {"ru": [], "en": []}
 
     return _LUNAR_TABLES
 
 
+# Static description records. Namedtuples instead of 4-key dicts: field
+# access is a C-level slot load, not a hash probe, and the keyword tuples
+# are shared immutables.
+SignInfo = namedtuple("SignInfo", "element quality keywords ru")
+PlanetInfo = namedtuple("PlanetInfo", "keywords ru")
+
 # Zodiac sign descriptions
 SIGN_DESCRIPTIONS = {
-    ZodiacSign.ARIES: {
-        "element": "fire",
-        "quality": "cardinal",
-        "keywords": ["initiative", "courage", "impulsiveness", "leadership"],
-        "ru": "Овен",
-    },
-    ZodiacSign.TAURUS: {
-        "element": "earth",
-        "quality": "fixed",
-        "keywords": ["stability", "sensuality", "persistence", "material"],
-        "ru": "Телец",
-    },
-    ZodiacSign.GEMINI: {
-        "element": "air",
-        "quality": "mutable",
-        "keywords": ["communication", "curiosity", "adaptability", "duality"],
-        "ru": "Близнецы",
-    },
-    ZodiacSign.CANCER: {
-        "element": "water",
-        "quality": "cardinal",
-        "keywords": ["nurturing", "emotion", "protection", "home"],
-        "ru": "Рак",
-    },
-    ZodiacSign.LEO: {
-        "element": "fire",
-        "quality": "fixed",
-        "keywords": ["creativity", "pride", "generosity", "drama"],
-        "ru": "Лев",
-    },
-    ZodiacSign.VIRGO: {
-        "element": "earth",
-        "quality": "mutable",
-        "keywords": ["analysis", "service", "perfectionism", "health"],
-        "ru": "Дева",
-    },
-    ZodiacSign.LIBRA: {
-        "element": "air",
-        "quality": "cardinal",
-        "keywords": ["balance", "partnership", "diplomacy", "aesthetics"],
-        "ru": "Весы",
+    ZodiacSign.ARIES: SignInfo(
+        element="fire",
+        quality="cardinal",
+        keywords=("initiative", "courage", "impulsiveness", "leadership"),
+        ru="Овен",
+    ),
+    ZodiacSign.TAURUS: SignInfo(
+        element="earth",
+        quality="fixed",
+        keywords=("stability", "sensuality", "persistence", "material"),
+        ru="Телец",
+    ),
+    ZodiacSign.GEMINI: SignInfo(
+        element="air",
+        quality="mutable",
+        keywords=("communication", "curiosity", "adaptability", "duality"),
+        ru="Близнецы",
+    ),
+    ZodiacSign.CANCER: SignInfo(
+        element="water",
+        quality="cardinal",
+        keywords=("nurturing", "emotion", "protection", "home"),
+        ru="Рак",
+    ),
+    ZodiacSign.LEO: SignInfo(
+        element="fire",
+        quality="fixed",
+        keywords=("creativity", "pride", "generosity", "drama"),
+        ru="Лев",
+    ),
+    ZodiacSign.VIRGO: SignInfo(
+        element="earth",
+        quality="mutable",
+        keywords=("analysis", "service", "perfectionism", "health"),
+        ru="Дева",
+    ),
+    ZodiacSign.LIBRA: SignInfo(
+        element="air",
+        quality="cardinal",
+        keywords=("balance", "partnership", "diplomacy", "aesthetics"),
+        ru="Весы",
+    ),
+    ZodiacSign.SCORPIO: SignInfo(
+        element="water",
+        quality="fixed",
+        keywords=("intensity", "transformation", "power", "secrets"),
+        ru="Скорпион",
+    ),
+    ZodiacSign.SAGITTARIUS: SignInfo(
+        element="fire",
+        quality="mutable",
+        keywords=("expansion", "philosophy", "adventure", "optimism"),
+        ru="Стрелец",
+    ),
+    ZodiacSign.CAPRICORN: SignInfo(
+        element="earth",
+        quality="cardinal",
+        keywords=("ambition", "discipline", "structure", "achievement"),
+        ru="Козерог",
+    ),
+    ZodiacSign.AQUARIUS: SignInfo(
+        element="air",
+        quality="fixed",
+        keywords=("innovation", "independence", "humanitarianism", "eccentricity"),
+        ru="Водолей",
+    ),
+    ZodiacSign.PISCES: SignInfo(
+        element="water",
+        quality="mutable",
+        keywords=("intuition", "compassion", "imagination", "escapism"),
+        ru="Рыбы",
+    ),
+}
+
+# Planet descriptions
+PLANET_DESCRIPTIONS = {
+    Planet.SUN: PlanetInfo(keywords=("identity", "ego", "vitality", "purpose"), ru="Солнце"),
+    Planet.MOON: PlanetInfo(keywords=("emotions", "instincts", "habits", "mother"), ru="Луна"),
+    Planet.MERCURY: PlanetInfo(keywords=("communication", "thinking", "learning", "travel"), ru="Меркурий"),
+    Planet.VENUS: PlanetInfo(keywords=("love", "beauty", "values", "pleasure"), ru="Венера"),
+    Planet.MARS: PlanetInfo(keywords=("action", "desire", "aggression", "energy"), ru="Марс"),
+    Planet.JUPITER: PlanetInfo(keywords=("expansion", "luck", "wisdom", "growth"), ru="Юпитер"),
+    Planet.SATURN: PlanetInfo(keywords=("structure", "limits", "responsibility", "time"), ru="Сатурн"),
+    Planet.URANUS: PlanetInfo(keywords=("revolution", "innovation", "freedom", "sudden change"), ru="Уран"),
+    Planet.NEPTUNE: PlanetInfo(keywords=("dreams", "illusion", "spirituality", "confusion"), ru="Нептун"),
+    Planet.PLUTO: PlanetInfo(keywords=("transformation", "power", "death/rebirth", "secrets"), ru="Плутон"),
+    Planet.NORTH_NODE: PlanetInfo(keywords=("destiny", "growth direction", "karma"), ru="Северный узел"),
+    Planet.SOUTH_NODE: PlanetInfo(keywords=("past life", "comfort zone", "release"), ru="Южный узел"),
+    Planet.CHIRON: PlanetInfo(keywords=("wound", "healing", "teaching", "vulnerability"), ru="Хирон"),
+}
+
+# Flat name tables keyed by the enum itself, built once at import. The hot
+# formatting paths used to do `PLANET_DESCRIPTIONS.get(x, {}).get("ru",
+# x.value)` per field — two lookups and a throwaway dict each time.
+_PLANET_RU = {p: d.ru for p, d in PLANET_DESCRIPTIONS.items()}
+_PLANET_EN = {p: p.value for p in Planet}
+_SIGN_RU = {s: d.ru for s, d in SIGN_DESCRIPTIONS.items()}
+_SIGN_EN = {s: s.value for s in ZodiacSign}
+
+# Tense aspects that warrant a caution in event recommendations
+_HARD_ASPECTS = frozenset({AspectType.SQUARE, AspectType.OPPOSITION})
+
+
+def _prep_reasoner_transits(
+    transits: list[TransitInfo],
+    retrograde_planets: list[Planet],
+) -> tuple[list[dict], list[str]]:
+    """Build the transit dicts and Russian retrograde names the reasoner
+    prompts expect. Shared by the horoscope and event-forecast paths, and
+    the prepared retrograde names are reused by the template fallback
+    instead of re-walking the lists."""
+    # Explicit loop with bound locals: LOAD_FAST for the name table and
+    # the append method, and each attribute read once per transit.
+    names = _PLANET_RU
+    names_get = names.get
+    transits_dict: list[dict] = []
+    append = transits_dict.append
+    for t in transits:
+        tp = t.transiting_planet
+        np_ = t.natal_planet
+        append({
+            "transit_planet": names_get(tp, tp.value),
+            "natal_planet": names_get(np_, np_.value),
+            "aspect": t.aspect.value,
+            "orb": t.orb,
+        })
+    retro_list = [names_get(p, p.value) for p in retrograde_planets]
+    return transits_dict, retro_list
+
+# Static per-locale strings, hoisted so the template fallbacks don't
+# re-evaluate bilingual ternaries and rebuild these dicts on every call.
+# Tips are tuples: immutable, shared, extendable into a list.
+_EVENT_TIPS = {
+    "ru": {
+        EventType.TRAVEL: (
+            "Проверьте документы заранее",
+            "Имейте запасной план",
+        ),
+        EventType.WEDDING: (
+            "Уделите внимание деталям",
+            "Сохраняйте спокойствие",
+        ),
+        EventType.BUSINESS: (
+            "Подготовьте все документы",
+            "Будьте готовы к переговорам",
+        ),
+        EventType.INTERVIEW: (
+            "Изучите компанию заранее",
+            "Подготовьте вопросы",
+        ),
     },
-    ZodiacSign.SCORPIO: {
-        "element": "water",
-        "quality": "fixed",
-        "keywords": ["intensity", "transformation", "power", "secrets"],
-        "ru": "Скорпион",
+    "en": {
+        EventType.TRAVEL: (
+            "Check documents in advance",
+            "Have a backup plan",
+        ),
+        EventType.WEDDING: (
+            "Pay attention to details",
+            "Stay calm",
+        ),
+        EventType.BUSINESS: (
+            "Prepare all documents",
+            "Be ready to negotiate",
+        ),
+        EventType.INTERVIEW: (
+            "Research the company beforehand",
+            "Prepare questions",
+        ),
     },
-    ZodiacSign.SAGITTARIUS: {
-        "element": "fire",
-        "quality": "mutable",
-        "keywords": ["expansion", "philosophy", "adventure", "optimism"],
-        "ru": "Стрелец",
+}
+
+# Phase vocabulary collapsed to the three moods the template sections
+# actually distinguish. The quarters land in "transition" — that matches
+# the old substring logic ("waxing"/"waning" never matched a quarter key)
+# and reads right: quarters are the turning points.
+_PHASE_CATEGORY = {
+    "full_moon": "bright",
+    "waxing_crescent": "bright",
+    "waxing_gibbous": "bright",
+    "waning_gibbous": "waning",
+    "waning_crescent": "waning",
+}
+
+# Natal prompt per output language, the locale branch evaluated once at
+# import. Only the target-language clause differs; the instructions stay
+# Russian either way (the models handle it, and it keeps one source of
+# truth for the section list).
+_NATAL_PROMPT_BODY = """
+
+Планеты: {planets}
+
+Аспекты: {aspects}
+
+Дай интерпретацию по разделам:
+1. Общая характеристика личности
+2. Эмоциональная сфера
+3. Коммуникация и мышление
+4. Отношения
+5. Карьера
+6. Сильные стороны
+7. Зоны роста
+
+Используй научный астрологический подход. Избегай категоричных утверждений."""
+
+# Bump when the natal prompt wording changes so cached completions for
+# the old wording are not replayed.
+_PROMPT_VERSION = b"natal-v1"
+
+
+# Prompt payload rows. orjson serializes slots dataclasses natively in
+# field order, so these replace throwaway dicts built per chart — same
+# bytes out, ~4x less per-row object overhead in.
+@dataclass(slots=True)
+class _PlanetRow:
+    planet: str
+    sign: str
+    degree: float
+    retrograde: bool
+    house: Optional[int]
+
+
+@dataclass(slots=True)
+class _AspectRow:
+    planet1: str
+    planet2: str
+    aspect: str
+    orb: float
+
+_NATAL_PROMPT_TEMPLATES = {
+    "ru": "Проанализируй натальную карту и дай интерпретацию на русском языке." + _NATAL_PROMPT_BODY,
+    "en": "Проанализируй натальную карту и дай интерпретацию на английском языке." + _NATAL_PROMPT_BODY,
+}
+
+# Residual per-locale strings for the recommendation and template paths;
+# picked once per call instead of inline ternaries. "influence" is a
+# format string because the planet name is interpolated at runtime.
+_TEXTS = {
+    "ru": {
+        "influence": "Учитывайте влияние {}",
+        "mercury_warning": "Перепроверьте все коммуникации",
+        "key_aspects": "\n**Ключевые аспекты:**\n",
     },
-    ZodiacSign.CAPRICORN: {
-        "element": "earth",
-        "quality": "cardinal",
-        "keywords": ["ambition", "discipline", "structure", "achievement"],
-        "ru": "Козерог",
+    "en": {
+        "influence": "Consider the influence of {}",
+        "mercury_warning": "Double-check all communications",
+        "key_aspects": "\n**Key Aspects:**\n",
     },
-    ZodiacSign.AQUARIUS: {
-        "element": "air",
-        "quality": "fixed",
-        "keywords": ["innovation", "independence", "humanitarianism", "eccentricity"],
-        "ru": "Водолей",
+}
+
+# Lunar phase display names per locale
+_PHASE_NAMES = {
+    "ru": {
+        "new_moon": "Новолуние",
+        "waxing_crescent": "Растущий серп",
+        "first_quarter": "Первая четверть",
+        "waxing_gibbous": "Растущая Луна",
+        "full_moon": "Полнолуние",
+        "waning_gibbous": "Убывающая Луна",
+        "last_quarter": "Последняя четверть",
+        "waning_crescent": "Убывающий серп",
     },
-    ZodiacSign.PISCES: {
-        "element": "water",
-        "quality": "mutable",
-        "keywords": ["intuition", "compassion", "imagination", "escapism"],
-        "ru": "Рыбы",
+    "en": {
+        "new_moon": "New Moon",
+        "waxing_crescent": "Waxing Crescent",
+        "first_quarter": "First Quarter",
+        "waxing_gibbous": "Waxing Gibbous",
+        "full_moon": "Full Moon",
+        "waning_gibbous": "Waning Gibbous",
+        "last_quarter": "Last Quarter",
+        "waning_crescent": "Waning Crescent",
     },
 }
 
-# Planet descriptions
-PLANET_DESCRIPTIONS = {
-    Planet.SUN: {"keywords": ["identity", "ego", "vitality", "purpose"], "ru": "Солнце"},
-    Planet.MOON: {"keywords": ["emotions", "instincts", "habits", "mother"], "ru": "Луна"},
-    Planet.MERCURY: {"keywords": ["communication", "thinking", "learning", "travel"], "ru": "Меркурий"},
-    Planet.VENUS: {"keywords": ["love", "beauty", "values", "pleasure"], "ru": "Венера"},
-    Planet.MARS: {"keywords": ["action", "desire", "aggression", "energy"], "ru": "Марс"},
-    Planet.JUPITER: {"keywords": ["expansion", "luck", "wisdom", "growth"], "ru": "Юпитер"},
-    Planet.SATURN: {"keywords": ["structure", "limits", "responsibility", "time"], "ru": "Сатурн"},
-    Planet.URANUS: {"keywords": ["revolution", "innovation", "freedom", "sudden change"], "ru": "Уран"},
-    Planet.NEPTUNE: {"keywords": ["dreams", "illusion", "spirituality", "confusion"], "ru": "Нептун"},
-    Planet.PLUTO: {"keywords": ["transformation", "power", "death/rebirth", "secrets"], "ru": "Плутон"},
-    Planet.NORTH_NODE: {"keywords": ["destiny", "growth direction", "karma"], "ru": "Северный узел"},
-    Planet.SOUTH_NODE: {"keywords": ["past life", "comfort zone", "release"], "ru": "Южный узел"},
-    Planet.CHIRON: {"keywords": ["wound", "healing", "teaching", "vulnerability"], "ru": "Хирон"},
+
+# Section header markers (RU and EN) for parsing structured interpretations.
+# Compiled once into a single alternation with one named group per section:
+# one regex scan per line instead of a Python loop over every keyword of
+# every section, and `m.lastgroup` names the section that matched.
+_SECTION_MARKERS = {
+    "personality": [
+        "общая характеристика", "personality", "личность",
+        "характер", "core", "identity"
+    ],
+    "strengths": [
+        "сильные стороны", "strengths", "таланты",
+        "talents", "abilities", "достоинства"
+    ],
+    "challenges": [
+        "зоны роста", "challenges", "сложности",
+        "трудности", "areas of growth", "проблемы"
+    ],
+    "relationships": [
+        "отношения", "relationships", "любовь",
+        "love", "партнерство", "partnership"
+    ],
+    "career": [
+        "карьера", "career", "профессия",
+        "работа", "work", "profession"
+    ],
+    "life_purpose": [
+        "предназначение", "life purpose", "purpose",
+        "миссия", "mission", "calling"
+    ],
 }
 
+_SECTION_RE = re.compile(
+    "|".join(
+        f"(?P<{key}>{'|'.join(re.escape(word) for word in words)})"
+        for key, words in _SECTION_MARKERS.items()
+    )
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_structured_sections_cached(interpretation: str, locale: str) -> dict:
+    """Scan interpretation text into named sections (cached on the text).
+
+    Identical text recurs — the reasoner cache replays responses and the
+    template fallback is deterministic — so the line scan runs once per
+    distinct interpretation.
+    """
+    sections = {
+        "personality": "",
+        "strengths": "",
+        "challenges": "",
+        "relationships": "",
+        "career": "",
+        "life_purpose": "",
+    }
+
+    # Split by sections
+    lines = interpretation.split("\n")
+    current_section = None
+    current_text = []
+
+    for line in lines:
+        line_clean = line.strip()
+        if not line_clean:
+            continue
+
+        line_lower = line_clean.lower()
+
+        # Check if this line is a section header: a marker keyword plus
+        # header shape (starts with #, **, or numbered, or ends with :).
+        matched_section = None
+        m = _SECTION_RE.search(line_lower)
+        if m and (line_clean.startswith("#") or
+                  line_clean.startswith("**") or
+                  line_clean.startswith(("1", "2", "3", "4", "5", "6", "7", "8", "9")) or
+                  line_clean.endswith(":")):
+            matched_section = m.lastgroup
+
+        if matched_section:
+            # Save previous section
+            if current_section and current_text:
+                sections[current_section] = "\n".join(current_text).strip()
+            current_section = matched_section
+            current_text = []
+        elif current_section:
+            # Add line to current section
+            current_text.append(line_clean)
+
+    # Save last section
+    if current_section and current_text:
+        sections[current_section] = "\n".join(current_text).strip()
+
+    # Fallback: if sections are empty, try to extract from full text
+    if not any(sections.values()):
+        # Just put everything in personality as fallback
+        sections["personality"] = interpretation
+
+    return sections
+
 
 class AstrologyInterpreter:
     """
@@ -152,15 +497,18 @@ class AstrologyInterpreter:
     - Event forecasts
     """
 
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, llm_timeout: float = 20.0):
         """
         Initialize interpreter.
 
         Args:
             llm_client: LLM client for generating interpretations.
                        If None, uses AstroReasoner with template-based fallback.
+            llm_timeout: Seconds to wait for an injected llm_client before
+                        falling back to the template — tune per provider.
         """
         self.llm_client = llm_client
+        self.llm_timeout = llm_timeout
 
         # Initialize AstroReasoner for advanced interpretation
         try:
@@ -209,16 +557,37 @@ class AstrologyInterpreter:
                 houses_dict = self._format_houses_for_reasoner(houses) if houses else None
                 aspects_dict = self._format_aspects_for_reasoner(aspects)
 
-                interpretation = await self.reasoner.interpret_natal_chart(
-                    planets=planets_dict,
-                    houses=houses_dict,
-                    aspects=aspects_dict,
-                    birth_date=birth_date,
-                    birth_time=birth_time,
-                    birth_place=birth_place,
-                    coords=coords,
-                    timezone=timezone,
-                    locale=locale,
+                cache_key = (
+                    "natal",
+                    locale,
+                    birth_date,
+                    birth_time,
+                    birth_place,
+                    timezone,
+                    tuple(sorted(
+                        (p.planet.value, p.sign.value, round(p.sign_degree, 1),
+                         p.retrograde, p.house)
+                        for p in planets
+                    )),
+                    tuple(sorted(
+                        (a.planet1.value, a.planet2.value, a.aspect_type.value,
+                         round(a.orb, 1))
+                        for a in aspects
+                    )),
+                )
+                interpretation = await _cached_reason(
+                    cache_key,
+                    lambda: self.reasoner.interpret_natal_chart(
+                        planets=planets_dict,
+                        houses=houses_dict,
+                        aspects=aspects_dict,
+                        birth_date=birth_date,
+                        birth_time=birth_time,
+                        birth_place=birth_place,
+                        coords=coords,
+                        timezone=timezone,
+                        locale=locale,
+                    ),
                 )
                 return interpretation
             except Exception as e:
@@ -248,32 +617,45 @@ class AstrologyInterpreter:
             Tuple of (summary, sections_dict, recommendations_list)
         """
         # Try AstroReasoner first if available
+        retro_list = None
         if self.reasoner and sun_sign and moon_sign:
+            transits_dict, retro_list = _prep_reasoner_transits(
+                transits, retrograde_planets
+            )
             try:
-                transits_dict = [
-                    {
-                        "transit_planet": PLANET_DESCRIPTIONS.get(t.transiting_planet, {}).get("ru", t.transiting_planet.value),
-                        "natal_planet": PLANET_DESCRIPTIONS.get(t.natal_planet, {}).get("ru", t.natal_planet.value),
-                        "aspect": t.aspect.value,
-                        "orb": t.orb,
-                    }
-                    for t in transits
-                ]
-
-                retro_list = [PLANET_DESCRIPTIONS.get(p, {}).get("ru", p.value) for p in retrograde_planets]
-
-                summary, sections, recommendations = await self.reasoner.interpret_horoscope(
-                    sun_sign=SIGN_DESCRIPTIONS.get(sun_sign, {}).get("ru", sun_sign.value),
-                    moon_sign=SIGN_DESCRIPTIONS.get(moon_sign, {}).get("ru", moon_sign.value),
-                    ascendant=SIGN_DESCRIPTIONS.get(ascendant, {}).get("ru", ascendant.value) if ascendant else None,
-                    transits=transits_dict,
-                    retrograde_planets=retro_list,
-                    lunar_phase=lunar_phase,
-                    lunar_day=lunar_day,
-                    period=period.value,
-                    period_start=period_start or "",
-                    period_end=period_end or "",
-                    locale=locale,
+                cache_key = (
+                    "horoscope",
+                    locale,
+                    sun_sign.value,
+                    moon_sign.value,
+                    ascendant.value if ascendant else None,
+                    tuple(sorted(
+                        (t.transiting_planet.value, t.natal_planet.value,
+                         t.aspect.value, round(t.orb, 1))
+                        for t in transits
+                    )),
+                    tuple(sorted(p.value for p in retrograde_planets)),
+                    lunar_phase,
+                    lunar_day,
+                    period.value,
+                    period_start or "",
+                    period_end or "",
+                )
+                summary, sections, recommendations = await _cached_reason(
+                    cache_key,
+                    lambda: self.reasoner.interpret_horoscope(
+                        sun_sign=_SIGN_RU.get(sun_sign, sun_sign.value),
+                        moon_sign=_SIGN_RU.get(moon_sign, moon_sign.value),
+                        ascendant=_SIGN_RU.get(ascendant, ascendant.value) if ascendant else None,
+                        transits=transits_dict,
+                        retrograde_planets=retro_list,
+                        lunar_phase=lunar_phase,
+                        lunar_day=lunar_day,
+                        period=period.value,
+                        period_start=period_start or "",
+                        period_end=period_end or "",
+                        locale=locale,
+                    ),
                 )
 
                 # Extract recommendations from sections
@@ -287,9 +669,66 @@ class AstrologyInterpreter:
 
         # Fallback to template
         return self._template_interpret_horoscope(
-            transits, retrograde_planets, lunar_phase, lunar_day, period, locale
+            transits, retrograde_planets, lunar_phase, lunar_day, period, locale,
+            retro_names_ru=retro_list,
         )
 
+    async def batch_interpret_horoscope(
+        self,
+        requests: list[dict],
+        max_concurrency: int = 10,
+    ) -> list:
+        """Interpret several horoscopes concurrently.
+
+        For bulk jobs (daily horoscopes for every sign x locale, evaluation
+        sweeps) serial awaiting makes throughput equal N x provider latency.
+        A semaphore bounds in-flight reasoner calls; the per-call cache and
+        template fallback apply unchanged.
+
+        Args:
+            requests: Keyword-argument dicts for interpret_horoscope
+            max_concurrency: Maximum reasoner calls in flight at once
+
+        Returns:
+            One result per request, in order; a failed request yields its
+            exception instead of cancelling the rest.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(kwargs: dict):
+            async with semaphore:
+                return await self.interpret_horoscope(**kwargs)
+
+        return await asyncio.gather(
+            *(_one(r) for r in requests), return_exceptions=True
+        )
+
+    async def interpret_bundle(
+        self,
+        natal_inputs: dict,
+        horoscope_inputs: dict,
+    ) -> tuple:
+        """Run natal and horoscope interpretation concurrently.
+
+        The common product flow requests both for one user; awaiting them
+        serially pays two full LLM round-trips back to back. Both calls go
+        out together, so the wall time is the slower of the two, and each
+        keeps its own cache key and template fallback.
+
+        Args:
+            natal_inputs: Keyword arguments for interpret_natal_chart
+            horoscope_inputs: Keyword arguments for interpret_horoscope
+
+        Returns:
+            (natal_interpretation, horoscope_result) — horoscope_result is
+            the usual (summary, sections, recommendations) tuple.
+        """
+        natal, horoscope = await asyncio.gather(
+            self.interpret_natal_chart(**natal_inputs),
+            self.interpret_horoscope(**horoscope_inputs),
+        )
+        return natal, horoscope
+
     async def generate_event_recommendations(
         self,
         event_type: EventType,
@@ -314,24 +753,16 @@ class AstrologyInterpreter:
         # Try AstroReasoner first if natal chart is available
         if self.reasoner and sun_sign and moon_sign and event_date:
             try:
-                transits_dict = [
-                    {
-                        "transit_planet": PLANET_DESCRIPTIONS.get(t.transiting_planet, {}).get("ru", t.transiting_planet.value),
-                        "natal_planet": PLANET_DESCRIPTIONS.get(t.natal_planet, {}).get("ru", t.natal_planet.value),
-                        "aspect": t.aspect.value,
-                        "orb": t.orb,
-                    }
-                    for t in transits
-                ]
-
-                retro_list = [PLANET_DESCRIPTIONS.get(p, {}).get("ru", p.value) for p in (retrograde_planets or [])]
+                transits_dict, retro_list = _prep_reasoner_transits(
+                    transits, retrograde_planets or []
+                )
 
                 result = await self.reasoner.interpret_event_forecast(
                     event_type=event_type.value,
                     event_date=event_date,
                     event_location=event_location,
-                    sun_sign=SIGN_DESCRIPTIONS.get(sun_sign, {}).get("ru", sun_sign.value),
-                    moon_sign=SIGN_DESCRIPTIONS.get(moon_sign, {}).get("ru", moon_sign.value),
+                    sun_sign=_SIGN_RU.get(sun_sign, sun_sign.value),
+                    moon_sign=_SIGN_RU.get(moon_sign, moon_sign.value),
                     transits=transits_dict,
                     retrograde_planets=retro_list,
                     lunar_phase=lunar_phase or "",
@@ -345,50 +776,38 @@ class AstrologyInterpreter:
                 logger.error(f"AstroReasoner event forecast failed, falling back to template: {e}")
 
         # Fallback to template-based recommendations
-        recommendations = []
+        lang = "ru" if locale == "ru" else "en"
+        texts = _TEXTS[lang]
+        recommendations = list(_EVENT_TIPS[lang].get(event_type, ())[:5])
 
-        # Base recommendations by event type
-        event_tips = {
-            EventType.TRAVEL: [
-                "Проверьте документы заранее" if locale == "ru" else "Check documents in advance",
-                "Имейте запасной план" if locale == "ru" else "Have a backup plan",
-            ],
-            EventType.WEDDING: [
-                "Уделите внимание деталям" if locale == "ru" else "Pay attention to details",
-                "Сохраняйте спокойствие" if locale == "ru" else "Stay calm",
-            ],
-            EventType.BUSINESS: [
-                "Подготовьте все документы" if locale == "ru" else "Prepare all documents",
-                "Будьте готовы к переговорам" if locale == "ru" else "Be ready to negotiate",
-            ],
-            EventType.INTERVIEW: [
-                "Изучите компанию заранее" if locale == "ru" else "Research the company beforehand",
-                "Подготовьте вопросы" if locale == "ru" else "Prepare questions",
-            ],
-        }
-
-        recommendations.extend(event_tips.get(event_type, []))
-
-        # Add transit-based recommendations
+        # No transits (common for simple event queries) → the base tips
+        # are the whole answer; skip the scan entirely.
+        if not transits:
+            return recommendations
+
+        planet_names = _PLANET_RU if lang == "ru" else _PLANET_EN
+
+        # One pass over transits: collect hard-aspect cautions, note Mercury,
+        # and stop once the 5-recommendation cap is reached anyway.
+        influence = texts["influence"]
+        mercury_seen = False
         for transit in transits:
-            if transit.aspect in [AspectType.SQUARE, AspectType.OPPOSITION]:
-                if locale == "ru":
-                    recommendations.append(
-                        f"Учитывайте влияние {PLANET_DESCRIPTIONS[transit.transiting_planet]['ru']}"
-                    )
-                else:
-                    recommendations.append(
-                        f"Consider the influence of {transit.transiting_planet.value}"
-                    )
+            if len(recommendations) >= 5:
+                break
+            if transit.aspect in _HARD_ASPECTS:
+                recommendations.append(
+                    influence.format(planet_names[transit.transiting_planet])
+                )
+            if transit.transiting_planet is Planet.MERCURY:
+                mercury_seen = True
 
         # Add retrograde warnings
-        if Planet.MERCURY in [t.transiting_planet for t in transits]:
-            if locale == "ru":
-                recommendations.append("Перепроверьте все коммуникации")
-            else:
-                recommendations.append("Double-check all communications")
+        if mercury_seen and len(recommendations) < 5:
+            recommendations.append(texts["mercury_warning"])
 
-        return recommendations[:5]  # Limit to 5 recommendations
+        # The build loop and the Mercury check both respect the cap, so no
+        # trailing slice copy is needed.
+        return recommendations
 
     async def interpret_natal_structured(
         self,
@@ -426,133 +845,78 @@ class AstrologyInterpreter:
 
         return sections
 
+    async def stream_natal_sections(
+        self,
+        planets: list[PlanetPosition],
+        houses: Optional[list[House]],
+        aspects: list[Aspect],
+        locale: str = "ru",
+        **birth_context,
+    ):
+        """Yield (section_name, text) pairs of the structured interpretation.
+
+        Sections arrive in the fixed personality → life_purpose order,
+        skipping empty ones, so a caller can render progressively instead
+        of waiting for the whole dict. Granularity is per section, not per
+        token: the provider chain (backend/core/llm_provider.py) returns
+        whole completions, so token-level streaming has nowhere to come
+        from until a provider exposes it.
+        """
+        sections = await self.interpret_natal_structured(
+            planets=planets,
+            houses=houses,
+            aspects=aspects,
+            locale=locale,
+            **birth_context,
+        )
+        for name, text in sections.items():
+            if text:
+                yield name, text
+
     def _parse_structured_sections(self, interpretation: str, locale: str) -> dict:
-        """Parse structured sections from interpretation text."""
-        sections = {
-            "personality": "",
-            "strengths": "",
-            "challenges": "",
-            "relationships": "",
-            "career": "",
-            "life_purpose": "",
-        }
-
-        # Section markers (RU and EN)
-        markers = {
-            "personality": [
-                "общая характеристика", "personality", "личность",
-                "характер", "core", "identity"
-            ],
-            "strengths": [
-                "сильные стороны", "strengths", "таланты",
-                "talents", "abilities", "достоинства"
-            ],
-            "challenges": [
-                "зоны роста", "challenges", "сложности",
-                "трудности", "areas of growth", "проблемы"
-            ],
-            "relationships": [
-                "отношения", "relationships", "любовь",
-                "love", "партнерство", "partnership"
-            ],
-            "career": [
-                "карьера", "career", "профессия",
-                "работа", "work", "profession"
-            ],
-            "life_purpose": [
-                "предназначение", "life purpose", "purpose",
-                "миссия", "mission", "calling"
-            ],
-        }
-
-        # Split by sections
-        lines = interpretation.split("\n")
-        current_section = None
-        current_text = []
-
-        for line in lines:
-            line_clean = line.strip()
-            if not line_clean:
-                continue
-
-            line_lower = line_clean.lower()
-
-            # Check if this line is a section header
-            matched_section = None
-            for section_key, keywords in markers.items():
-                if any(keyword in line_lower for keyword in keywords):
-                    # Check if it looks like a header (starts with #, **, or numbered)
-                    if (line_clean.startswith("#") or
-                        line_clean.startswith("**") or
-                        line_clean.startswith(("1", "2", "3", "4", "5", "6", "7", "8", "9")) or
-                        line_clean.endswith(":")):
-                        matched_section = section_key
-                        break
-
-            if matched_section:
-                # Save previous section
-                if current_section and current_text:
-                    sections[current_section] = "\n".join(current_text).strip()
-                current_section = matched_section
-                current_text = []
-            elif current_section:
-                # Add line to current section
-                current_text.append(line_clean)
-
-        # Save last section
-        if current_section and current_text:
-            sections[current_section] = "\n".join(current_text).strip()
-
-        # Fallback: if sections are empty, try to extract from full text
-        if not any(sections.values()):
-            # Just put everything in personality as fallback
-            sections["personality"] = interpretation
+        """Parse structured sections from interpretation text.
 
-        return sections
+        Delegates to a memoized module-level parser; the shallow copy
+        keeps callers from mutating the cached entry.
+        """
+        return dict(_parse_structured_sections_cached(interpretation, locale))
 
     def _format_planets_for_reasoner(self, planets: list[PlanetPosition]) -> list[dict]:
         """Format planets for AstroReasoner."""
-        result = []
-        for p in planets:
-            sign_info = SIGN_DESCRIPTIONS.get(p.sign, {})
-            planet_info = PLANET_DESCRIPTIONS.get(p.planet, {})
-
-            result.append({
-                "name": planet_info.get("ru", p.planet.value),
-                "sign": sign_info.get("ru", p.sign.value),
+        return [
+            {
+                "name": _PLANET_RU.get(p.planet, p.planet.value),
+                "sign": _SIGN_RU.get(p.sign, p.sign.value),
                 "sign_degree": p.sign_degree,
                 "retrograde": p.retrograde,
                 "house": p.house,
-            })
-        return result
+            }
+            for p in planets
+        ]
 
     def _format_houses_for_reasoner(self, houses: list[House]) -> list[dict]:
         """Format houses for AstroReasoner."""
-        result = []
-        for h in houses:
-            sign_info = SIGN_DESCRIPTIONS.get(h.sign, {})
-            result.append({
+        return [
+            {
                 "number": h.number,
-                "sign": sign_info.get("ru", h.sign.value),
+                "sign": _SIGN_RU.get(h.sign, h.sign.value),
                 "degree": h.cusp_degree,
-            })
-        return result
+            }
+            for h in houses
+        ]
 
     def _format_aspects_for_reasoner(self, aspects: list[Aspect]) -> list[dict]:
         """Format aspects for AstroReasoner."""
-        result = []
-        for a in aspects:
-            p1_info = PLANET_DESCRIPTIONS.get(a.planet1, {})
-            p2_info = PLANET_DESCRIPTIONS.get(a.planet2, {})
-
-            result.append({
-                "planet1": p1_info.get("ru", a.planet1.value),
-                "planet2": p2_info.get("ru", a.planet2.value),
+        return [
+            {
+                "planet1": _PLANET_RU.get(a.planet1, a.planet1.value),
+                "planet2": _PLANET_RU.get(a.planet2, a.planet2.value),
                 "type": a.aspect_type.value,
                 "orb": a.orb,
                 "applying": a.applying,
-            })
-        return result
+            }
+            for a in aspects
+        ]
 
     # Russian aspect names, so the fallback doesn't emit "Солнце opposition Луна".
     _ASPECT_RU = {
@@ -578,48 +942,49 @@ class AstrologyInterpreter:
         nurturing, emotion") reads as broken. This path is a fallback for a
         client with no model of its own; connectors interpret the data instead.
         """
-        lines = []
+        # Single linear buffer instead of a list plus a final join pass
+        buf = io.StringIO()
+        write = buf.write
 
-        sun = next((p for p in planets if p.planet == Planet.SUN), None)
-        moon = next((p for p in planets if p.planet == Planet.MOON), None)
+        by_planet = {p.planet: p for p in planets}
+        sun = by_planet.get(Planet.SUN)
+        moon = by_planet.get(Planet.MOON)
 
         if sun:
             sign_info = SIGN_DESCRIPTIONS[sun.sign]
             if locale == "ru":
-                lines.append(f"**Солнце в знаке {sign_info['ru']}**")
-                lines.append(
-                    "Основная энергия и чувство «я» окрашены качествами этого знака."
-                )
+                write(f"**Солнце в знаке {sign_info.ru}**\n")
+                write("Основная энергия и чувство «я» окрашены качествами этого знака.\n")
             else:
-                kw = ", ".join(sign_info["keywords"][:3])
-                lines.append(f"**Sun in {sun.sign.value.title()}**")
-                lines.append(f"Your core identity relates to {sun.sign.value} qualities: {kw}.")
+                kw = ", ".join(sign_info.keywords[:3])
+                write(f"**Sun in {sun.sign.value.title()}**\n")
+                write(f"Your core identity relates to {sun.sign.value} qualities: {kw}.\n")
 
         if moon:
             sign_info = SIGN_DESCRIPTIONS[moon.sign]
             if locale == "ru":
-                lines.append(f"\n**Луна в знаке {sign_info['ru']}**")
-                lines.append(
-                    "Эмоциональные потребности выражаются через призму этого знака."
-                )
+                write(f"\n**Луна в знаке {sign_info.ru}**\n")
+                write("Эмоциональные потребности выражаются через призму этого знака.\n")
             else:
-                lines.append(f"\n**Moon in {moon.sign.value.title()}**")
-                lines.append(f"Your emotional needs are expressed through {moon.sign.value} energy.")
+                write(f"\n**Moon in {moon.sign.value.title()}**\n")
+                write(f"Your emotional needs are expressed through {moon.sign.value} energy.\n")
 
         if aspects:
-            lines.append("\n**Ключевые аспекты:**" if locale == "ru" else "\n**Key Aspects:**")
-            for aspect in aspects[:5]:
-                if locale == "ru":
-                    p1 = PLANET_DESCRIPTIONS[aspect.planet1]["ru"]
-                    p2 = PLANET_DESCRIPTIONS[aspect.planet2]["ru"]
-                    rel = self._ASPECT_RU.get(aspect.aspect_type, aspect.aspect_type.value)
-                    lines.append(f"- {p1} — {rel} {p2}")
-                else:
-                    lines.append(
-                        f"- {aspect.planet1.value} {aspect.aspect_type.value} {aspect.planet2.value}"
+            write(_TEXTS["ru" if locale == "ru" else "en"]["key_aspects"])
+            # Locale decided once, not per aspect line.
+            if locale == "ru":
+                names = _PLANET_RU
+                aspect_ru = self._ASPECT_RU
+                for aspect in islice(aspects, 5):
+                    rel = aspect_ru.get(aspect.aspect_type, aspect.aspect_type.value)
+                    write(f"- {names[aspect.planet1]} — {rel} {names[aspect.planet2]}\n")
+            else:
+                for aspect in islice(aspects, 5):
+                    write(
+                        f"- {aspect.planet1.value} {aspect.aspect_type.value} {aspect.planet2.value}\n"
                     )
 
-        return "\n".join(lines)
+        return buf.getvalue().rstrip("\n")
 
     def _template_interpret_horoscope(
         self,
@@ -629,41 +994,28 @@ class AstrologyInterpreter:
         lunar_day: int,
         period: HoroscopePeriod,
         locale: str,
+        retro_names_ru: Optional[list[str]] = None,
     ) -> tuple[str, dict[str, str], list[str]]:
-        """Template-based horoscope interpretation (fallback)."""
-        tables = _load_lunar_tables()
+        """Template-based horoscope interpretation (fallback).
 
-        # Map phase keys to Russian/English
-        phase_names_ru = {
-            "new_moon": "Новолуние",
-            "waxing_crescent": "Растущий серп",
-            "first_quarter": "Первая четверть",
-            "waxing_gibbous": "Растущая Луна",
-            "full_moon": "Полнолуние",
-            "waning_gibbous": "Убывающая Луна",
-            "last_quarter": "Последняя четверть",
-            "waning_crescent": "Убывающий серп",
-        }
-        phase_names_en = {
-            "new_moon": "New Moon",
-            "waxing_crescent": "Waxing Crescent",
-            "first_quarter": "First Quarter",
-            "waxing_gibbous": "Waxing Gibbous",
-            "full_moon": "Full Moon",
-            "waning_gibbous": "Waning Gibbous",
-            "last_quarter": "Last Quarter",
-            "waning_crescent": "Waning Crescent",
-        }
+        `retro_names_ru` lets interpret_horoscope hand over the Russian
+        retrograde names it already built for the reasoner prompt.
+        """
+        tables = _load_lunar_tables()
 
         # Summary
         if locale == "ru":
-            phase_display = phase_names_ru.get(lunar_phase, lunar_phase)
+            phase_display = _PHASE_NAMES["ru"].get(lunar_phase, lunar_phase)
             summary = f"{lunar_day} лунный день. {phase_display}. "
             if retrograde_planets:
-                retro_names = [PLANET_DESCRIPTIONS[p]["ru"] for p in retrograde_planets]
+                retro_names = (
+                    retro_names_ru
+                    if retro_names_ru is not None
+                    else [_PLANET_RU[p] for p in retrograde_planets]
+                )
                 summary += f"Ретроградные планеты: {', '.join(retro_names)}."
         else:
-            phase_display = phase_names_en.get(lunar_phase, lunar_phase)
+            phase_display = _PHASE_NAMES["en"].get(lunar_phase, lunar_phase)
             summary = f"Lunar day {lunar_day}. {phase_display}. "
             if retrograde_planets:
                 retro_names = [p.value for p in retrograde_planets]
@@ -677,6 +1029,7 @@ class AstrologyInterpreter:
                 lunar_info = lang_tables[lunar_day]
 
         # Sections based on lunar phase and day
+        phase_category = _PHASE_CATEGORY.get(lunar_phase, "transition")
         sections = {}
         recommendations = []
 
@@ -690,9 +1043,9 @@ class AstrologyInterpreter:
                 sections["energy"] = f"{lunar_day} лунный день несёт особую энергетику."
 
             # Love section based on phase
-            if "full_moon" in lunar_phase or "waxing" in lunar_phase:
+            if phase_category == "bright":
                 sections["love"] = "Благоприятное время для открытого общения и проявления чувств."
-            elif "waning" in lunar_phase:
+            elif phase_category == "waning":
                 sections["love"] = "Время для углубления отношений и работы над взаимопониманием."
             else:
                 sections["love"] = "Период перехода в отношениях. Хороший момент для рефлексии."
@@ -727,9 +1080,9 @@ class AstrologyInterpreter:
                 sections["energy"] = f"Lunar day {lunar_day} carries special energy."
 
             # Love section based on phase
-            if "full_moon" in lunar_phase or "waxing" in lunar_phase:
+            if phase_category == "bright":
                 sections["love"] = "Favorable time for open communication and expressing feelings."
-            elif "waning" in lunar_phase:
+            elif phase_category == "waning":
                 sections["love"] = "Time for deepening relationships and working on mutual understanding."
             else:
                 sections["love"] = "Transitional period in relationships. Good moment for reflection."
@@ -765,47 +1118,61 @@ class AstrologyInterpreter:
         locale: str,
     ) -> str:
         """LLM-based natal chart interpretation."""
-        # Format planet data for prompt
-        planet_data = []
-        for p in planets:
-            sign_info = SIGN_DESCRIPTIONS[p.sign]
-            planet_data.append({
-                "planet": PLANET_DESCRIPTIONS[p.planet]["ru"] if locale == "ru" else p.planet.value,
-                "sign": sign_info["ru"] if locale == "ru" else p.sign.value,
-                "degree": round(p.sign_degree, 1),
-                "retrograde": p.retrograde,
-                "house": p.house,
-            })
+        # Pick the localized tables once, not per field
+        planet_names = _PLANET_RU if locale == "ru" else _PLANET_EN
+        sign_names = _SIGN_RU if locale == "ru" else _SIGN_EN
+
+        planet_data = [
+            _PlanetRow(
+                planet=planet_names[p.planet],
+                sign=sign_names[p.sign],
+                degree=round(p.sign_degree, 1),
+                retrograde=p.retrograde,
+                house=p.house,
+            )
+            for p in planets
+        ]
 
         aspect_data = [
-            {
-                "planet1": PLANET_DESCRIPTIONS[a.planet1]["ru"] if locale == "ru" else a.planet1.value,
-                "planet2": PLANET_DESCRIPTIONS[a.planet2]["ru"] if locale == "ru" else a.planet2.value,
-                "aspect": a.aspect_type.value,
-                "orb": round(a.orb, 1),
-            }
-            for a in aspects[:10]
+            _AspectRow(
+                planet1=planet_names[a.planet1],
+                planet2=planet_names[a.planet2],
+                aspect=a.aspect_type.value,
+                orb=round(a.orb, 1),
+            )
+            for a in islice(aspects, 10)
         ]
 
-        prompt = f"""Проанализируй натальную карту и дай интерпретацию на {'русском' if locale == 'ru' else 'английском'} языке.
-
-Планеты: {planet_data}
-
-Аспекты: {aspect_data}
-
-Дай интерпретацию по разделам:
-1. Общая характеристика личности
-2. Эмоциональная сфера
-3. Коммуникация и мышление
-4. Отношения
-5. Карьера
-6. Сильные стороны
-7. Зоны роста
+        # Valid compact JSON for the model, serialized in C — not Python
+        # repr with single quotes the model has to guess its way around.
+        planets_json = orjson.dumps(planet_data)
+        aspects_json = orjson.dumps(aspect_data)
+        prompt = _NATAL_PROMPT_TEMPLATES["ru" if locale == "ru" else "en"].format(
+            planets=planets_json.decode(),
+            aspects=aspects_json.decode(),
+        )
 
-Используй научный астрологический подход. Избегай категоричных утверждений."""
+        # Natal input is deterministic for a birth instant, so the whole
+        # round-trip is content-addressable. _PROMPT_VERSION busts stale
+        # entries when the template wording changes.
+        cache_key = (
+            "llm_natal",
+            hashlib.blake2b(
+                planets_json + aspects_json + locale.encode() + _PROMPT_VERSION,
+                digest_size=16,
+            ).hexdigest(),
+        )
 
         try:
-            response = await self.llm_client.generate(prompt)
+            # Unbounded, a stalled provider holds the request (and the
+            # async worker) open indefinitely; the timeout caps the tail
+            # and hands the user the template instead.
+            response = await _cached_reason(
+                cache_key,
+                lambda: asyncio.wait_for(
+                    self.llm_client.generate(prompt), timeout=self.llm_timeout
+                ),
+            )
             return response
         except Exception as e:
             logger.error(f"LLM interpretation failed: {e}")
@@ -826,3 +1193,12 @@ class AstrologyInterpreter:
         return self._template_interpret_horoscope(
             transits, retrograde_planets, lunar_phase, lunar_day, period, locale
         )
+
+
+# Warm the lunar tables off the request path: without this the first
+# horoscope request pays the file read + parse. Daemon thread so it never
+# blocks interpreter shutdown; the lock in the loader handles the race
+# with an early request.
+threading.Thread(
+    target=_load_lunar_tables, name="lunar-tables-preload", daemon=True
+).start()
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict
 
+import orjson
+
 from .validators.quality_gates import QualityReport, detect_numeric_hallucination, enforce_llm_output_claims
 
 
-def interpret(computed_json: Dict[str, Any], kb: Dict[str, Any], llm_output: Dict[str, Any]) -> tuple[Dict[str, Any], QualityReport]:
+async def interpret(computed_json: Dict[str, Any], kb: Dict[str, Any], llm_output: Dict[str, Any]) -> tuple[Dict[str, Any], QualityReport]:
+    """Validate LLM output against the computed chart.
+
+    The claim check and the numeric-hallucination scan are independent, so
+    they run in worker threads concurrently — the hallucination pass scans
+    the full serialized output and grows with chart size. The output is
+    serialized once with orjson rather than Python repr: compact, and the
+    numeric literals come out exactly as json would render them.
+    """
     report = QualityReport()
-    enforce_llm_output_claims(llm_output, report)
-    hallucinations = detect_numeric_hallucination(str(llm_output), computed_json)
+    serialized = orjson.dumps(llm_output).decode()
+    _, hallucinations = await asyncio.gather(
+        asyncio.to_thread(enforce_llm_output_claims, llm_output, report),
+        asyncio.to_thread(detect_numeric_hallucination, serialized, computed_json),
+    )
     if hallucinations:
         report.add_error("LLM_NUMERIC_HALLUCINATION")
     return llm_output, report
@@ -2,10 +2,17 @@
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+import pytz
+
+# pytz.timezone parses zoneinfo data on every call; charts overwhelmingly
+# reuse a small set of zones, so memoize the objects.
+_tz = lru_cache(maxsize=512)(pytz.timezone)
+
 from .chart_core import HOUSE_SYSTEM_CODES, resolve_house_system
-from .ephemeris import SwissEphemeris
+from .ephemeris import SwissEphemeris, julian_day_ut
 from .schemas import (
     Aspect,
     AspectType,
@@ -44,6 +51,18 @@ ASPECT_ANGLES = {
     AspectType.OPPOSITION: 180,
 }
 
+# Sign → ordinal, so the cusp fallback doesn't rebuild list(ZodiacSign)
+# and O(N)-scan it with .index() per house.
+_ZODIAC_INDEX = {sign: i for i, sign in enumerate(ZodiacSign)}
+
+# (type, exact angle, orb) flattened once so the per-pair scan reads a
+# tuple row instead of iterating ASPECT_ANGLES and probing ASPECT_ORBS.
+# Order preserved: the scan takes the first angle within orb.
+_ASPECT_CHECKS = tuple(
+    (aspect_type, float(angle), float(ASPECT_ORBS[aspect_type]))
+    for aspect_type, angle in ASPECT_ANGLES.items()
+)
+
 
 
 def _to_utc_or_raise(birth_dt: datetime, timezone: str) -> datetime:
@@ -57,10 +76,8 @@ def _to_utc_or_raise(birth_dt: datetime, timezone: str) -> datetime:
     schema-validated caller override, a failure now means a real bug — and a
     chart computed from the wrong instant is worse than no chart at all.
     """
-    import pytz
-
     try:
-        local_tz = pytz.timezone(timezone)
+        local_tz = _tz(timezone)
     except Exception as exc:
         raise ValueError(
             f"Unknown timezone {timezone!r} — refusing to compute a chart, "
@@ -113,9 +130,10 @@ class NatalChartCalculator:
         utc_dt = _to_utc_or_raise(birth_dt, timezone)
 
         planets = []
+        north_node = None
 
         for planet in Planet:
-            if planet == Planet.SOUTH_NODE:
+            if planet is Planet.SOUTH_NODE:
                 # South Node is opposite North Node
                 continue
 
@@ -125,20 +143,21 @@ class NatalChartCalculator:
 
             sign, sign_degree = self.ephemeris.get_zodiac_sign(data.longitude)
 
-            planets.append(
-                PlanetPosition(
-                    planet=planet,
-                    sign=sign,
-                    degree=data.longitude,
-                    sign_degree=sign_degree,
-                    retrograde=self.ephemeris.is_retrograde(data.speed),
-                    house=None,  # Will be filled after house calculation
-                    speed_deg_per_day=data.speed,
-                )
+            position = PlanetPosition(
+                planet=planet,
+                sign=sign,
+                degree=data.longitude,
+                sign_degree=sign_degree,
+                retrograde=self.ephemeris.is_retrograde(data.speed),
+                house=None,  # Will be filled after house calculation
+                speed_deg_per_day=data.speed,
             )
+            planets.append(position)
+            if planet is Planet.NORTH_NODE:
+                # Remembered here so the South Node below doesn't rescan
+                north_node = position
 
         # Add South Node (opposite of North Node)
-        north_node = next((p for p in planets if p.planet == Planet.NORTH_NODE), None)
         if north_node:
             south_node_degree = (north_node.degree + 180) % 360
             south_sign, south_sign_degree = self.ephemeris.get_zodiac_sign(
@@ -192,10 +211,9 @@ class NatalChartCalculator:
         utc_dt = _to_utc_or_raise(birth_dt, timezone)
         swe = self.ephemeris._swe
 
-        jd = swe.julday(
-            utc_dt.year, utc_dt.month, utc_dt.day,
-            utc_dt.hour + utc_dt.minute / 60.0 + utc_dt.second / 3600.0
-        )
+        # Same instant the planet loop already converted — the memoized
+        # helper returns the cached jd instead of redoing the arithmetic.
+        jd = julian_day_ut(utc_dt)
 
         requested = _SYSTEM_NAMES.get(system.upper(), "placidus")
         system_used, note = resolve_house_system(jd, latitude, longitude, requested)
@@ -249,23 +267,16 @@ class NatalChartCalculator:
 
         planet_map = {p.planet: p for p in planets if p.planet in major_planets}
 
-        checked_pairs = set()
-
-        for planet1_enum in major_planets:
-            for planet2_enum in major_planets:
-                if planet1_enum == planet2_enum:
-                    continue
-
-                # Avoid duplicate pairs
-                pair = tuple(sorted([planet1_enum.value, planet2_enum.value]))
-                if pair in checked_pairs:
-                    continue
-                checked_pairs.add(pair)
-
-                planet1 = planet_map.get(planet1_enum)
-                planet2 = planet_map.get(planet2_enum)
-
-                if not planet1 or not planet2:
+        # j > i walks each unordered pair exactly once — no mirrored pairs
+        # to skip, no sorted-tuple set to dedup them.
+        n = len(major_planets)
+        for i in range(n):
+            planet1 = planet_map.get(major_planets[i])
+            if not planet1:
+                continue
+            for j in range(i + 1, n):
+                planet2 = planet_map.get(major_planets[j])
+                if not planet2:
                     continue
 
                 aspect = self._find_aspect(planet1, planet2)
@@ -300,8 +311,7 @@ class NatalChartCalculator:
         # d(delta)/dt: |s| grows at (speed1-speed2) when s>0, shrinks when s<0.
         d_delta_dt = speed_diff if s >= 0 else -speed_diff
 
-        for aspect_type, exact_angle in ASPECT_ANGLES.items():
-            orb = ASPECT_ORBS[aspect_type]
+        for aspect_type, exact_angle, orb in _ASPECT_CHECKS:
             deviation = delta - exact_angle
 
             if abs(deviation) <= orb:
@@ -343,7 +353,7 @@ class NatalChartCalculator:
         cusp_degrees = [
             h.cusp_degree
             if h.cusp_degree is not None
-            else h.degree + (list(ZodiacSign).index(h.sign) * 30)
+            else h.degree + (_ZODIAC_INDEX[h.sign] * 30)
             for h in houses
         ]
 
@@ -64,6 +64,11 @@ class Planet(str, Enum):
     CHIRON = "chiron"
 
 
+# Signs in declaration order (Aries → Pisces), so longitude // 30
+# indexes directly instead of rebuilding list(ZodiacSign) per call.
+ZODIAC_SIGN_ORDER: tuple[ZodiacSign, ...] = tuple(ZodiacSign)
+
+
 class AspectType(str, Enum):
     """Aspect types between planets."""
     CONJUNCTION = "conjunction"      # 0°
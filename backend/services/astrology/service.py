@@ -28,6 +28,11 @@ from .transits import TransitCalculator
 from .geocoder import GeoLocation, Geocoder, GeocodingError
 from .interpreter import AstrologyInterpreter
 
+# Bound once: _now(_UTC) resolves two attribute chains
+# per call, and the service stamps several objects per request.
+_UTC = dt_timezone.utc
+_now = datetime.now
+
 from backend.core import ephemeris as ephe_config
 
 # Import lunar service for accurate lunar day calculation
@@ -67,7 +72,7 @@ class AstrologyService:
         return ProvenanceInfo(
             ephemeris_engine=ephe_config.ENGINE_LABEL,
             ephemeris_version=ephe_config.EPHEMERIS_VERSION,
-            calculation_timestamp=datetime.now(dt_timezone.utc),
+            calculation_timestamp=_now(_UTC),
             methodology="Placidus houses (natal chart) | Tropical zodiac | Geocentric coordinates",
             accuracy_statement=ephe_config.ACCURACY_STATEMENT,
         )
@@ -116,7 +121,6 @@ class AstrologyService:
                 provider="caller-supplied",
                 query=request.birth_place,
                 raw_response_id="",
-                timestamp=datetime.now(tz=dt_timezone.utc),
             )
             logger.info(
                 f"Using caller-supplied coordinates {location.latitude}/"
@@ -168,8 +172,8 @@ class AstrologyService:
         aspects = self.natal_calculator.calculate_aspects(planets)
 
         # Get Sun and Moon signs
-        sun_position = next(p for p in planets if p.planet == Planet.SUN)
-        moon_position = next(p for p in planets if p.planet == Planet.MOON)
+        sun_position = next(p for p in planets if p.planet is Planet.SUN)
+        moon_position = next(p for p in planets if p.planet is Planet.MOON)
 
         # Interpretation is the AI layer — optional. Skipped for connector
         # callers, whose own chat model reads the deterministic chart directly.
@@ -242,7 +246,7 @@ class AstrologyService:
             ).core,
             interpretation=interpretation,
             structured_interpretation=structured_interpretation,
-            created_at=datetime.now(dt_timezone.utc),
+            created_at=_now(_UTC),
             provenance=self._get_provenance(),
         )
 
@@ -359,7 +363,7 @@ class AstrologyService:
             career_and_finance=sections.get("career"),
             health_and_wellness=sections.get("health"),
             recommendations=recommendations,
-            created_at=datetime.now(dt_timezone.utc),
+            created_at=_now(_UTC),
             provenance=self._get_provenance(),
         )
 
@@ -460,7 +464,7 @@ class AstrologyService:
             risk_factors=risk_factors,
             recommendations=recommendations,
             alternative_dates=alternative_dates,
-            created_at=datetime.now(dt_timezone.utc),
+            created_at=_now(_UTC),
             provenance=self._get_provenance(),
         )
 
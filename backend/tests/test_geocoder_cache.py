@@ -0,0 +1,152 @@
+"""Behavior of the process-wide geocode caches.
+
+The positive cache turns a repeated place string into a dict lookup
+instead of a GeoNames round-trip; the negative cache keeps a typo from
+being re-sent on every retry, but only for _NEGATIVE_TTL_SECONDS and
+only for queries long enough to look deliberate. All tests isolate
+state through the _clear_geocode_caches hook.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from backend.services.astrology import geocoder as geo
+from backend.services.astrology.geocoder import Geocoder, GeocodingError
+
+ROME_RESULT = {
+    "resolved_name": "Rome",
+    "lat": 41.89193,
+    "lon": 12.51133,
+    "timezone": "Europe/Rome",
+    "country": "Italy",
+    "geonameId": 3169070,
+    "name_matched": True,
+}
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    geo._clear_geocode_caches()
+    yield
+    geo._clear_geocode_caches()
+
+
+def _stub_success(monkeypatch, calls: list):
+    async def fake_lookup(query):
+        calls.append(query)
+        return dict(ROME_RESULT)
+
+    monkeypatch.setattr(geo, "geonames_lookup", fake_lookup)
+
+
+def _stub_not_found(monkeypatch, calls: list):
+    async def fake_lookup(query):
+        calls.append(query)
+        raise ValueError("Place not found")
+
+    monkeypatch.setattr(geo, "geonames_lookup", fake_lookup)
+
+
+# ── positive cache ──────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_repeat_query_is_served_from_cache(monkeypatch):
+    calls: list = []
+    _stub_success(monkeypatch, calls)
+    geocoder = Geocoder()
+
+    first = await geocoder.geocode("Rome")
+    second = await geocoder.geocode("Rome")
+
+    assert calls == ["Rome"], "the second geocode must not reach GeoNames"
+    assert second is first, "the cache shares the frozen GeoLocation"
+
+
+@pytest.mark.asyncio
+async def test_cache_key_normalizes_case_and_whitespace(monkeypatch):
+    calls: list = []
+    _stub_success(monkeypatch, calls)
+    geocoder = Geocoder()
+
+    first = await geocoder.geocode("Rome")
+    second = await geocoder.geocode("  ROME ")
+
+    assert len(calls) == 1
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_positive_cache_evicts_oldest_entry(monkeypatch):
+    calls: list = []
+    _stub_success(monkeypatch, calls)
+    monkeypatch.setattr(geo, "_GEO_CACHE_MAX", 2)
+    geocoder = Geocoder()
+
+    await geocoder.geocode("Rome")
+    await geocoder.geocode("Milan")
+    await geocoder.geocode("Turin")
+
+    assert len(geo._GEO_CACHE) == 2
+    assert "geonames|rome" not in geo._GEO_CACHE, "LRU drops the oldest"
+
+    await geocoder.geocode("Rome")
+    assert calls == ["Rome", "Milan", "Turin", "Rome"], "evicted entry re-fetches"
+
+
+# ── negative cache ──────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_failed_lookup_is_not_retried_within_ttl(monkeypatch):
+    calls: list = []
+    _stub_not_found(monkeypatch, calls)
+    geocoder = Geocoder()
+
+    with pytest.raises(GeocodingError, match="PLACE_NOT_FOUND"):
+        await geocoder.geocode("Atlantis")
+    with pytest.raises(GeocodingError, match="PLACE_NOT_FOUND"):
+        await geocoder.geocode("Atlantis")
+
+    assert calls == ["Atlantis"], "the replay must come from the negative cache"
+
+
+@pytest.mark.asyncio
+async def test_negative_entry_expires_after_ttl(monkeypatch):
+    calls: list = []
+    _stub_not_found(monkeypatch, calls)
+    geocoder = Geocoder()
+
+    with pytest.raises(GeocodingError):
+        await geocoder.geocode("Atlantis")
+
+    # Age the stored entry past the TTL instead of sleeping through it.
+    key = "geonames|atlantis"
+    stored_at, code = geo._NEGATIVE_CACHE[key]
+    geo._NEGATIVE_CACHE[key] = (
+        time.monotonic() - geo._NEGATIVE_TTL_SECONDS - 1.0,
+        code,
+    )
+
+    with pytest.raises(GeocodingError):
+        await geocoder.geocode("Atlantis")
+
+    assert len(calls) == 2, "an expired negative entry must re-fetch"
+
+
+@pytest.mark.asyncio
+async def test_short_queries_are_never_negative_cached(monkeypatch):
+    calls: list = []
+    _stub_not_found(monkeypatch, calls)
+    geocoder = Geocoder()
+
+    # Two chars passes the validity floor but sits under the negative
+    # gate — a quick retype after a slip must not be poisoned.
+    with pytest.raises(GeocodingError):
+        await geocoder.geocode("Ro")
+    with pytest.raises(GeocodingError):
+        await geocoder.geocode("Ro")
+
+    assert len(calls) == 2
+    assert not geo._NEGATIVE_CACHE
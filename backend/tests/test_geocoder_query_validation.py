@@ -0,0 +1,92 @@
+"""Accept/reject boundary of the geocoder's local query filter.
+
+The filter exists to reject junk (digits, control characters, pastes)
+before it spends a rate-limited GeoNames round-trip — but it must not
+reject real place names. The regression that motivated these tests:
+the original character class allowed only the ASCII apostrophe, while
+iOS/Android smart punctuation types U+2019 (and some keyboards U+02BC),
+so «L’Aquila» and «N’Djamena» failed with PLACE_QUERY_INVALID from a
+mobile client and geocoded fine from a desktop one.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.services.astrology import geocoder as geo
+from backend.services.astrology.geocoder import Geocoder, GeocodingError
+
+ROME_RESULT = {
+    "resolved_name": "Rome",
+    "lat": 41.89193,
+    "lon": 12.51133,
+    "timezone": "Europe/Rome",
+    "country": "Italy",
+    "geonameId": 3169070,
+    "name_matched": True,
+}
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    geo._clear_geocode_caches()
+    yield
+    geo._clear_geocode_caches()
+
+
+def _stub_lookup(monkeypatch, calls: list):
+    async def fake_lookup(query):
+        calls.append(query)
+        return dict(ROME_RESULT)
+
+    monkeypatch.setattr(geo, "geonames_lookup", fake_lookup)
+
+
+# ── accepted: real names the filter must let through ────────────────────────
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "Moscow",
+        "Запорожье, Украина",
+        "Val-d'Or",          # ASCII apostrophe
+        "L’Aquila",          # U+2019 — what smart punctuation actually types
+        "N’Djamena",
+        "Nʼzeto",            # U+02BC modifier letter apostrophe
+        "Tyne & Wear",
+        "Washington, D.C.",
+    ],
+)
+async def test_real_place_names_pass_the_filter(monkeypatch, query):
+    calls: list = []
+    _stub_lookup(monkeypatch, calls)
+
+    location = await Geocoder().geocode(query)
+
+    assert calls == [query], "a valid name must reach the lookup"
+    assert location.name == "Rome"
+
+
+# ── rejected: junk that can never resolve ───────────────────────────────────
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "12345",
+        "12.34, 56.78",
+        "Moscow\x00",
+        "<script>alert(1)</script>",
+        "x" * 201,
+        "q",  # below the 2-char floor
+    ],
+)
+async def test_junk_is_rejected_before_the_network(monkeypatch, query):
+    calls: list = []
+    _stub_lookup(monkeypatch, calls)
+
+    with pytest.raises(GeocodingError, match="PLACE_QUERY_INVALID"):
+        await Geocoder().geocode(query)
+
+    assert calls == [], "rejected queries must not reach GeoNames"
@@ -12,6 +12,7 @@ Provides async geocoding using the official GeoNames API with:
 import os
 import asyncio
 import unicodedata
+from collections import OrderedDict
 from difflib import SequenceMatcher
 from functools import lru_cache
 from typing import Dict, Optional
@@ -101,6 +102,33 @@ POPULAR_CITIES = {
     "auckland": {"name": "Auckland", "country": "New Zealand", "lat": -37.0082, "lon": 174.7850, "timezone": "Pacific/Auckland"},
 }
 
+# Autocomplete entries for the offline fallback, prebuilt once. The
+# POPULAR_CITIES keys are lookup aliases (Russian and Latin spellings of the
+# same city), so the display dicts are composed here instead of being
+# re-formatted on every search call.
+_FALLBACK_SUGGESTIONS: list = [
+    (
+        city_key,
+        {
+            "name": city_data["name"],
+            "country": city_data["country"],
+            "admin_name": "",
+            "lat": city_data["lat"],
+            "lon": city_data["lon"],
+            "display": f"{city_data['name']}, {city_data['country']}",
+            "geoname_id": None,
+        },
+    )
+    for city_key, city_data in POPULAR_CITIES.items()
+]
+
+# Exact-alias index for the same entries: an O(1) hit for queries that name
+# a city outright, before falling back to the linear substring scan.
+_FALLBACK_BY_ALIAS: Dict[str, Dict] = {
+    city_key: entry for city_key, entry in _FALLBACK_SUGGESTIONS
+}
+
+
 # ── "City, Country" query parsing ───────────────────────────────────────────
 #
 # GeoNames' `q` is a free-text search. Passing the whole "Запорожье, Украина"
@@ -220,6 +248,16 @@ def name_matches(requested_city: str, candidate: Dict) -> bool:
     return False
 
 
+# Admin-area precedence for a GeoNames row, most specific first. A single
+# generator over this tuple keeps the order explicit and O(1) to extend,
+# instead of growing an `or` chain.
+_ADMIN_KEYS = ("adminName1", "adminName2", "adminName3")
+
+
+def _admin_area(entry: Dict) -> Optional[str]:
+    return next((entry[k] for k in _ADMIN_KEYS if entry.get(k)), None)
+
+
 def _population(entry: Dict) -> int:
     try:
         return int(entry.get("population") or 0)
@@ -232,7 +270,7 @@ def trim_candidate(entry: Dict) -> Dict:
     return {
         "name": entry.get("name", ""),
         "country": entry.get("countryName", ""),
-        "admin_area": entry.get("adminName1", "") or None,
+        "admin_area": _admin_area(entry),
         "lat": float(entry["lat"]) if entry.get("lat") is not None else None,
         "lon": float(entry["lng"]) if entry.get("lng") is not None else None,
         "population": _population(entry),
@@ -285,10 +323,20 @@ _http_client: Optional[httpx.AsyncClient] = None
 
 
 def get_http_client() -> httpx.AsyncClient:
-    """Get or create async HTTP client."""
+    """Get or create async HTTP client.
+
+    One client for the process lifetime so sequential GeoNames calls reuse
+    a kept-alive TLS connection instead of paying a fresh TCP+TLS handshake
+    (~100–300 ms) per lookup. The transport retries transient connection
+    failures before they surface as a failed geocode.
+    """
     global _http_client
     if _http_client is None:
-        _http_client = httpx.AsyncClient(timeout=10.0)
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        )
     return _http_client
 
 
@@ -344,8 +392,25 @@ def _cache_key(place_name: str) -> str:
     return place_name.lower().strip()
 
 
-# In-memory cache for resolved locations
-_location_cache: Dict[str, Dict] = {}
+# In-memory cache for resolved locations. Bounded LRU: long-running
+# workers see an endless stream of distinct queries, so an unbounded dict
+# is a slow leak. 1024 entries comfortably covers the hot set.
+_LOCATION_CACHE_MAX = 1024
+_location_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+
+def _cache_get(cache_key: str) -> Optional[Dict]:
+    result = _location_cache.get(cache_key)
+    if result is not None:
+        _location_cache.move_to_end(cache_key)
+    return result
+
+
+def _cache_put(cache_key: str, result: Dict) -> None:
+    _location_cache[cache_key] = result
+    _location_cache.move_to_end(cache_key)
+    while len(_location_cache) > _LOCATION_CACHE_MAX:
+        _location_cache.popitem(last=False)
 
 
 async def geonames_lookup(place_name: str) -> Dict:
@@ -375,9 +440,10 @@ async def geonames_lookup(place_name: str) -> Dict:
     """
     # Check cache first
     cache_key = _cache_key(place_name)
-    if cache_key in _location_cache:
+    cached = _cache_get(cache_key)
+    if cached is not None:
         logger.debug(f"GeoNames cache hit: {place_name}")
-        return _location_cache[cache_key]
+        return cached
 
     # "Запорожье, Украина" → q="Запорожье", country="UA". Sending the whole
     # string as `q` used to resolve a hamlet named after the country.
@@ -483,7 +549,7 @@ async def geonames_lookup(place_name: str) -> Dict:
                 "ambiguous": False,  # exact key hit in a curated list
             }
             # Cache successful result
-            _location_cache[cache_key] = result
+            _cache_put(cache_key, result)
             logger.info(f"[GeoNames] ✓ FALLBACK SUCCESS: '{place_name}' → '{result['resolved_name']}' ({result['country']})")
             logger.debug(f"[GeoNames] Using built-in popular cities database")
             return result
@@ -510,6 +576,7 @@ async def geonames_lookup(place_name: str) -> Dict:
         "requested_city": city,
         "resolved_name": place.get("name", ""),
         "country": place.get("countryName", ""),
+        "admin_area": _admin_area(place),
         "lat": float(place["lat"]),
         "lon": float(place["lng"]),
         "geonameId": place.get("geonameId"),
@@ -522,7 +589,7 @@ async def geonames_lookup(place_name: str) -> Dict:
     }
 
     # Cache successful result
-    _location_cache[cache_key] = result
+    _cache_put(cache_key, result)
     logger.info(f"[GeoNames] ✓ SUCCESS: '{place_name}' → '{result['resolved_name']}' ({result['country']})")
     logger.debug(f"[GeoNames] Coordinates: {result['lat']}, {result['lon']}, TZ: {result['timezone']}")
 
@@ -634,19 +701,21 @@ async def geonames_search_cities(query: str, max_results: int = 10) -> list[Dict
         logger.info(f"[GeoNames Search] No API results, searching popular cities database...")
         query_lower = search_query.lower()
 
-        # Search in popular cities (case-insensitive prefix match)
-        matching_cities = []
-        for city_key, city_data in POPULAR_CITIES.items():
-            if city_key.startswith(query_lower) or query_lower in city_key:
-                matching_cities.append({
-                    "name": city_data["name"],
-                    "country": city_data["country"],
-                    "admin_name": "",
-                    "lat": city_data["lat"],
-                    "lon": city_data["lon"],
-                    "display": f"{city_data['name']}, {city_data['country']}",
-                    "geoname_id": None,
-                })
+        # Exact alias hit first — a dict lookup instead of scanning every
+        # alias, and precise for short queries ("la", "ny") that would
+        # otherwise substring-match unrelated cities.
+        exact = _FALLBACK_BY_ALIAS.get(query_lower)
+        if exact is not None:
+            logger.info(f"[GeoNames Search] Exact fallback alias hit for '{query_lower}'")
+            return [exact.copy()]
+
+        # Otherwise scan (case-insensitive prefix/substring match); copies of
+        # the prebuilt entries so callers can mutate their results freely.
+        matching_cities = [
+            entry.copy()
+            for city_key, entry in _FALLBACK_SUGGESTIONS
+            if city_key.startswith(query_lower) or query_lower in city_key
+        ]
 
         # Sort by relevance (starts with query first)
         matching_cities.sort(key=lambda c: (